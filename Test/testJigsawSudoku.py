@@ -3,6 +3,7 @@ import math
 
 from context import jigsaw
 from jigsaw.jigsawSudoku import JigsawSudoku
+from jigsaw import jigsaw
 
 if __name__ == '__main__':
     unittest.main()
@@ -74,6 +75,37 @@ class TestJigsawSudoku(unittest.TestCase):
         with self.assertRaises(ValueError):
             dut = JigsawSudoku( dimension, shape)
 
+    def testCountSolutions(self):
+        # Arrange
+        dut = jigsaw.createSudoku()
+        # with only two given numbers the 4x4 jigsaw has more solutions
+        fewer = jigsaw.createSudokuFromLine('..3.4........... AABBAABBCCDDCCDD')
+
+        # Act
+        result = dut.CountSolutions()
+        fewerResult = fewer.CountSolutions()
+
+        # Assert
+        self.assertEqual(1, result[0])
+        self.assertEqual(2, fewerResult[0])
+
+    def testLineFormat(self):
+        # Arrange
+        line = '..3.4......1.4..' + ' ' + 'AABBAABBCCDDCCDD'
+
+        # Act
+        dut = jigsaw.createSudokuFromLine(line)
+
+        # Assert
+        self.assertEqual(3, dut.Get(0, 2))
+        self.assertEqual(4, dut.Get(1, 0))
+        self.assertEqual(self.createShape(4), dut.shape)
+        self.assertEqual(line, jigsaw.lineFromSudoku(dut))
+        with self.assertRaises(ValueError):
+            jigsaw.createSudokuFromLine('..3.4......1.4..')  # shape missing
+        with self.assertRaises(ValueError):
+            jigsaw.createSudokuFromLine('..3.4......1.4.. AAABAABBCCDDCCDD')  # bad shape
+
     def create4x4TestSudoku(self, dimension):
         # 4x4 sudoku for test
         #    Sudoku     Candidates  
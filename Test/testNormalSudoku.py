@@ -163,6 +163,172 @@ class TestNormalSudoku(unittest.TestCase):
         # Assert that the list of new candidates holds 2 candidates after
         self.assertTrue(len(candidatesrow7col2After) == 2)
 
+    def testSolveEmpty(self):
+        # Arrange
+        dut = NormalSudoku(4)
+
+        # Act
+        result = dut.Solve()
+
+        # Assert
+        self.assertTrue(result)
+        self.assertTrue(dut.Solved)
+        self.assertTrue(dut.Check())
+
+    def testSolveFindsSolution(self):
+        # Arrange
+        dut = normal.createSudoku3()
+
+        # Act
+        result = dut.Solve()
+
+        # Assert
+        self.assertTrue(result)
+        self.assertTrue(dut.Solved)
+        self.assertTrue(dut.Check())
+        self.assertEqual(8, dut.Get(0, 1)) # initial number is kept
+
+    def testSolveNoSolution(self):
+        # Arrange
+        # 4x4 sudoku without solution, no number fits cell [0][2]
+        #    0 1 2 3
+        #   ---------
+        # 0 !1.2! . !
+        # 1 ! . !3. !
+        #   !-.-!-.-!
+        # 2 ! . !4. !
+        # 3 ! . ! . !
+        #   ---------
+        dut = NormalSudoku(4)
+        dut.Set( 0, 0, 1, True)
+        dut.Set( 0, 1, 2, True)
+        dut.Set( 1, 2, 3, True)
+        dut.Set( 2, 2, 4, True)
+
+        # Act
+        result = dut.Solve()
+
+        # Assert
+        self.assertFalse(result)
+        self.assertFalse(dut.Solved)
+
+    def testSolveStopsAtMaxNodes(self):
+        # Arrange
+        dut = NormalSudoku(9)
+
+        # Act
+        result = dut.Solve(maxNodes=0)
+
+        # Assert
+        self.assertFalse(result)
+        self.assertFalse(dut.Solved)
+
+    def testSolveWithDancingLinks(self):
+        # Arrange
+        dut = normal.createSudoku3()
+
+        # Act
+        result = dut.Solve(engine='dlx')
+
+        # Assert
+        self.assertTrue(result)
+        self.assertTrue(dut.Solved)
+        self.assertTrue(dut.Check())
+        self.assertEqual(8, dut.Get(0, 1)) # initial number is kept
+
+    def testSolveWithDancingLinksNoSolution(self):
+        # Arrange
+        # same sudoku as in testSolveNoSolution
+        dut = NormalSudoku(4)
+        dut.Set( 0, 0, 1, True)
+        dut.Set( 0, 1, 2, True)
+        dut.Set( 1, 2, 3, True)
+        dut.Set( 2, 2, 4, True)
+
+        # Act
+        result = dut.Solve(engine='dlx')
+
+        # Assert
+        self.assertFalse(result)
+        self.assertFalse(dut.Solved)
+
+    def testCountSolutions(self):
+        # Arrange
+        unique = normal.createSudoku3()
+        line = normal.lineFromSudoku(unique)
+        # same sudoku as in testSolveNoSolution
+        none = NormalSudoku(4)
+        none.Set( 0, 0, 1, True)
+        none.Set( 0, 1, 2, True)
+        none.Set( 1, 2, 3, True)
+        none.Set( 2, 2, 4, True)
+
+        # Act
+        counts = [unique.CountSolutions(engine=engine)[0] for engine in ('rules', 'dlx')]
+        noneCount, noneNodes = none.CountSolutions()
+        emptyCount, emptyNodes = NormalSudoku(4).CountSolutions(limit=3)
+
+        # Assert
+        self.assertEqual([1, 1], counts)
+        self.assertEqual(line, normal.lineFromSudoku(unique)) # the sudoku isn't changed
+        self.assertEqual(0, noneCount)
+        self.assertEqual(3, emptyCount)
+        self.assertGreater(emptyNodes, 0)
+
+    def testCountSolutionsKeepsChanges(self):
+        # Arrange
+        dut = normal.createSudoku3()
+        cell = [cell for cell in dut.Cells if not cell.Solved][0]
+        solution = normal.createSudoku3()
+        solution.Solve()
+        cell.Number = solution.Cells[dut.Cells.index(cell)].Number # not committed yet
+        snapshot = dut.Snapshot()
+
+        for engine in ('rules', 'dlx'):
+            # Act
+            count = dut.CountSolutions(engine=engine)[0]
+
+            # Assert
+            self.assertEqual(1, count)
+            self.assertTrue(dut.Changed)
+            self.assertEqual(snapshot, dut.Snapshot())
+
+    def testCountSolutionsStopsAtMaxNodes(self):
+        # Arrange
+        dut = NormalSudoku(9)
+
+        # Act
+        count, nodes = dut.CountSolutions(maxNodes=1)
+
+        # Assert
+        self.assertIsNone(count)
+        self.assertEqual(1, nodes)
+
+    def testSolveUnknownEngine(self):
+        # Arrange
+        dut = NormalSudoku(4)
+
+        # Act and assert
+        with self.assertRaises(ValueError):
+            dut.Solve(engine='unknown')
+
+    def testLineFormat(self):
+        # Arrange
+        line = '.8..9..3..3.....699.2.63158.2.8.459.8519.7.463946.587.563.4.9872......15.1..5..2.'
+
+        # Act
+        dut = normal.createSudokuFromLine(line)
+
+        # Assert
+        self.assertEqual(8, dut.Get(0, 1))
+        self.assertEqual(0, dut.Get(0, 0))
+        self.assertEqual(line, normal.lineFromSudoku(dut))
+        self.assertEqual(line, normal.lineFromSudoku(normal.createSudoku3()))
+        with self.assertRaises(ValueError):
+            normal.createSudokuFromLine(line[1:])
+        with self.assertRaises(ValueError):
+            normal.createSudokuFromLine('.'*36) # 6x6 has no square groups
+
     def create9x9TestSudokuNakedPairRowAndGroup(self):
         sudoku= NormalSudoku( 9)
         sudoku.Set( 0, 0, 4,True)
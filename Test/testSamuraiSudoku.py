@@ -3,6 +3,7 @@ import math
 
 from normal import normal
 from samurai.samuraiSudoku import SamuraiSudoku
+from samurai import samurai
 
 if __name__ == '__main__':
     unittest.main()
@@ -142,6 +143,98 @@ class TestSamuraiSudoku(unittest.TestCase):
         self.assertTrue(resultSudoku[2][3].Solved)
         self.assertEqual(resultSudoku[2][3].Number, 1)
 
+    def testSolve(self):
+        #Arrange
+        dimension = 4
+        grid = 5
+        dut = SamuraiSudoku( dimension, grid)
+        dut.Set( 0, 0, 0, 2, True)
+        dut.Set( 2, 1, 1, 3, True)
+        dut.Set( 4, 3, 3, 1, True)
+        dut.DoChange()
+
+        #Act
+        result = dut.Solve()
+
+        #Assert
+        self.assertTrue(result)
+        self.assertTrue(dut.Solved)
+        self.assertTrue(dut.Check())
+        # shared cells have the same number
+        self.assertEqual(dut.Sudokus[0].Sudoku[3][3].Number, dut.Sudokus[2].Sudoku[1][1].Number)
+
+    def testSolveWithDancingLinks(self):
+        #Arrange
+        dimension = 4
+        grid = 5
+        dut = SamuraiSudoku( dimension, grid)
+        dut.Set( 0, 0, 0, 2, True)
+        dut.Set( 2, 1, 1, 3, True)
+        dut.Set( 4, 3, 3, 1, True)
+        dut.DoChange()
+
+        #Act
+        result = dut.Solve(engine='dlx')
+
+        #Assert
+        self.assertTrue(result)
+        self.assertTrue(dut.Solved)
+        self.assertTrue(dut.Check())
+        self.assertEqual(dut.Sudokus[4].Sudoku[0][0].Number, dut.Sudokus[2].Sudoku[2][2].Number)
+
+    def testCountSolutions(self):
+        # Arrange
+        dut = samurai.createSudoku()
+
+        # Act
+        result = [dut.CountSolutions(engine=engine)[0] for engine in ('rules', 'dlx')]
+
+        # Assert
+        self.assertEqual([1, 1], result)
+        self.assertFalse(dut.Solved)
+
+    def testCellsAreMadeInBoardOfGrid(self):
+        # Arrange, Act
+        dut = SamuraiSudoku(9, 5)
+
+        # Assert
+        for sudoku in dut.Sudokus:
+            self.assertTrue(all(cell.board is sudoku.Board for cell in sudoku.Cells))
+
+    def testRulesOfDriver(self):
+        # Arrange
+        dut = samurai.createSudoku()
+        grid = normal.createSudoku1()
+
+        # Act
+        names = [rule.Name for rule in dut.Pipeline.Rules]
+        gridNames = [rule.Name for rule in grid.Pipeline.Rules]
+
+        # Assert
+        # the rules are shared with the normal sudoku, only the naked pairs differ
+        self.assertIn('Find naked pairs', names)
+        self.assertEqual([name for name in gridNames if not name.startswith('Find naked pairs')]
+                        , [name for name in names if name != 'Find naked pairs'])
+        self.assertEqual(len(dut.Sudokus), len(dut.TrailMark()))
+
+    def testLineFormat(self):
+        # Arrange
+        # the lower right cell of grid 0 is only given there
+        line = '2..............3 ................ ................ ................ ...............1'
+
+        # Act
+        dut = samurai.createSudokuFromLine(line)
+
+        # Assert
+        self.assertEqual(2, dut.Sudokus[0].Get(0, 0))
+        self.assertEqual(3, dut.Sudokus[2].Get(1, 1)) # shared with grid 0
+        self.assertEqual('2..............3 ................ .....3.......... ................ ...............1'
+                        , samurai.lineFromSudoku(dut))
+        with self.assertRaises(ValueError):
+            samurai.createSudokuFromLine(line[:34] + '.....4..........' + line[50:]) # shared cell differs
+        with self.assertRaises(ValueError):
+            samurai.createSudokuFromLine(' '.join(['.'*36]*5)) # 6x6 has no square groups
+
     def create2x2plus1TestSamuraiSudoku(self, dimension, grid):
         #    0 1 2 3 0 1 2 3
         #   -----------------
@@ -211,6 +211,28 @@ class TestBaseCell(unittest.TestCase):
         self.assertIs( dut, resultFirstCell)
 
 
+    def testCandidateMaskAfterRemove(self):
+        # Arrange
+        dimension = 9
+        group = 0
+        row = 0
+        column = 0
+        dut = BaseCell( dimension, row, column, group)
+
+        # Act
+        dut.Remove(1)
+        dut.Remove(9)
+        resultNewMask = dut.NewCandidateMask
+        dut.DoChange()
+        resultMask = dut.CandidateMask
+
+        # Assert
+        self.assertEqual( 0b011111110, resultNewMask)
+        self.assertEqual( 0b011111110, resultMask)
+        self.assertEqual( [2,3,4,5,6,7,8], dut.Candidates)
+        self.assertTrue( dut.HasCandidate(2))
+        self.assertFalse( dut.HasCandidate(9))
+
     # def test(self):
     #     # Arrange
 
@@ -36,12 +36,27 @@ class TestBaseSudoku(unittest.TestCase):
         self.assertEqual(4, resultSudoku[1][0].Number)
 
     # for testing constructor
-    def createCell(self, dim, rw, cl):
+    def createCell(self, dim, rw, cl, board=None):
         rho = round(math.sqrt(dim))
         group = (rw//rho)*rho + (cl//rho) # upper left square is indexed 0, next to the right 1, and so forth.
-        cell = BaseCell( dim, rw, cl, group)
+        cell = BaseCell( dim, rw, cl, group, board)
         return cell
 
+    def testSetCell(self):
+        # Arrange
+        dut = BaseSudoku( 4, self.createCell, 'Test')
+        cell = self.createCell(4, 1, 2)
+        cell.SetNumber(3, True)
+
+        # Act
+        dut.SetCell(1, 2, cell)
+
+        # Assert
+        self.assertIs(cell, dut.GetCell(1, 2))
+        self.assertIs(cell, dut.Cells[1*4 + 2])
+        self.assertIn(cell, dut.Groups[1])
+        self.assertEqual(3, dut.Get(1, 2))
+
     def testDoChange(self):
         # Arrange
         dimension = 4
@@ -174,6 +189,28 @@ class TestBaseSudoku(unittest.TestCase):
         self.assertEqual( 2, dut.Sudoku[3][2].NewNumber)
 
 
+    def testFindPossibleCandidatesVisitsPlacedOnly(self):
+        # Arrange
+        dimension = 4
+        dut = self.create4x4TestSudoku(dimension, self.createCell)
+        self.dut = dut
+        dut.FindPossibleCandidatesBase(self.removeCandidatesInSquare)
+        dut.DoChange()
+
+        # Act
+        placedAfterFirst = dut.Board.TakePlaced()
+        dut.Set( 0, 0, 1)
+        dut.DoChange()
+        placedAfterSet = dut.Board.TakePlaced()
+        singles = dut.Board.TakeSingles()
+
+        # Assert
+        # The initial numbers are propagated by first call, then only the new number is placed.
+        # Cells [1][3] and [3][2] are reduced to the single candidate 2, see testSetSingleCandidatesAsnewNumber
+        self.assertEqual( [], placedAfterFirst)
+        self.assertEqual( [0], placedAfterSet)
+        self.assertEqual( [7, 14], singles)
+
     def removeCandidatesInSquare(self, cell):
         # 4x4 sudoku for test
         #    Sudoku     Square (=group) 
@@ -492,6 +529,171 @@ class TestBaseSudoku(unittest.TestCase):
         self.assertFalse(result)
         self.assertTrue(resultRowAndColumn)
 
+    def testFindNakedTripleInRow(self):
+        # Arrange
+        # row 0 of a 9x9 sudoku has the naked triple (1,2),(2,3),(1,3) in column 0, 1 and 2
+        dimension = 9
+        dut = BaseSudoku( dimension, self.createCell, 'Test')
+        for column, candidates in [(0, (1, 2)), (1, (2, 3)), (2, (1, 3))]:
+            for candidate in range(1, dimension+1):
+                if not candidate in candidates:
+                    dut.sudoku[0][column].Remove(candidate)
+        dut.DoChange()
+        row0 = 0
+
+        # Act
+        dut.FindNakedSubsetsUnit(row0, 2) # no pairs
+        changedAfterPairs = dut.Changed
+        dut.FindNakedSubsetsUnit(row0, 3)
+
+        # Assert
+        self.assertFalse(changedAfterPairs)
+        self.assertEqual([4, 5, 6, 7, 8, 9], dut.sudoku[0][3].NewCandidates)
+        self.assertEqual([4, 5, 6, 7, 8, 9], dut.sudoku[0][8].NewCandidates)
+        self.assertEqual([1, 2], dut.sudoku[0][0].Candidates)
+        self.assertTrue(dut.sudoku[0][0].IsMarked)
+        self.assertFalse(dut.sudoku[1][0].Changed) # other rows are left
+
+    def testFindNakedQuadInGroup(self):
+        # Arrange
+        # the group 0 of a 9x9 sudoku has the naked quad (1,2),(3,4),(1,2,3),(2,4)
+        dimension = 9
+        dut = BaseSudoku( dimension, self.createCell, 'Test')
+        for (row, column), candidates in [((0, 0), (1, 2)), ((1, 1), (3, 4)), ((2, 2), (1, 2, 3)), ((2, 0), (2, 4))]:
+            for candidate in range(1, dimension+1):
+                if not candidate in candidates:
+                    dut.sudoku[row][column].Remove(candidate)
+        dut.DoChange()
+
+        # Act
+        dut.FindNakedQuads()
+
+        # Assert
+        self.assertEqual([5, 6, 7, 8, 9], dut.sudoku[0][1].NewCandidates)
+        self.assertEqual([5, 6, 7, 8, 9], dut.sudoku[1][2].NewCandidates)
+        self.assertFalse(dut.sudoku[0][3].Changed) # not in a unit with the quad
+
+    def testFindHiddenPairInColumn(self):
+        # Arrange
+        # in column 0 of a 9x9 sudoku the numbers 1 and 2 are only candidates in row 0 and 5
+        dimension = 9
+        dut = BaseSudoku( dimension, self.createCell, 'Test')
+        for row in range(dimension):
+            if row != 0 and row != 5:
+                dut.sudoku[row][0].Remove(1)
+                dut.sudoku[row][0].Remove(2)
+        dut.DoChange()
+        column0 = dimension
+
+        # Act
+        dut.FindHiddenSubsetsUnit(column0, 2)
+
+        # Assert
+        self.assertEqual([1, 2], dut.sudoku[0][0].NewCandidates)
+        self.assertEqual([1, 2], dut.sudoku[5][0].NewCandidates)
+        self.assertTrue(dut.sudoku[5][0].IsMarked)
+        self.assertFalse(dut.sudoku[1][0].Changed)
+
+    def testFindHiddenTriples(self):
+        # Arrange
+        # in row 8 of a 9x9 sudoku the numbers 1, 2 and 3 are only candidates in column 0, 4 and 8
+        dimension = 9
+        dut = BaseSudoku( dimension, self.createCell, 'Test')
+        for column in range(dimension):
+            if not column in (0, 4, 8):
+                for candidate in (1, 2, 3):
+                    dut.sudoku[8][column].Remove(candidate)
+        dut.sudoku[8][4].Remove(3)
+        dut.DoChange()
+
+        # Act
+        dut.FindHiddenTriples()
+
+        # Assert
+        self.assertEqual([1, 2, 3], dut.sudoku[8][0].NewCandidates)
+        self.assertEqual([1, 2], dut.sudoku[8][4].NewCandidates)
+        self.assertEqual([1, 2, 3], dut.sudoku[8][8].NewCandidates)
+
+    def testFindLockedCandidatesPointing(self):
+        # Arrange
+        # in group 0 of a 9x9 sudoku the number 1 is only a candidate in row 0
+        dimension = 9
+        dut = BaseSudoku( dimension, self.createCell, 'Test')
+        for row in (1, 2):
+            for column in range(3):
+                dut.sudoku[row][column].Remove(1)
+        dut.DoChange()
+
+        # Act
+        dut.FindLockedCandidates()
+
+        # Assert
+        self.assertNotIn(1, dut.sudoku[0][5].NewCandidates)
+        self.assertNotIn(1, dut.sudoku[0][8].NewCandidates)
+        self.assertFalse(dut.sudoku[0][0].Changed)
+        self.assertFalse(dut.sudoku[1][5].Changed)
+
+    def testFindLockedCandidatesClaiming(self):
+        # Arrange
+        # in row 4 of a 9x9 sudoku the number 2 is only a candidate in group 4
+        dimension = 9
+        dut = BaseSudoku( dimension, self.createCell, 'Test')
+        for column in (0, 1, 2, 6, 7, 8):
+            dut.sudoku[4][column].Remove(2)
+        dut.DoChange()
+
+        # Act
+        dut.FindLockedCandidates()
+
+        # Assert
+        self.assertNotIn(2, dut.sudoku[3][3].NewCandidates)
+        self.assertNotIn(2, dut.sudoku[5][5].NewCandidates)
+        self.assertFalse(dut.sudoku[3][0].Changed)
+        self.assertFalse(dut.sudoku[4][4].Changed)
+
+    def testFindXWings(self):
+        # Arrange
+        # in rows 0 and 4 of a 9x9 sudoku the number 1 is only a candidate in columns 2 and 6
+        dimension = 9
+        dut = BaseSudoku( dimension, self.createCell, 'Test')
+        for row in (0, 4):
+            for column in range(dimension):
+                if column not in (2, 6):
+                    dut.sudoku[row][column].Remove(1)
+        dut.DoChange()
+
+        # Act
+        dut.FindXWings()
+
+        # Assert
+        self.assertNotIn(1, dut.sudoku[1][2].NewCandidates)
+        self.assertNotIn(1, dut.sudoku[8][6].NewCandidates)
+        self.assertFalse(dut.sudoku[0][2].Changed)
+        self.assertFalse(dut.sudoku[4][6].Changed)
+        self.assertFalse(dut.sudoku[1][3].Changed)
+
+    def testFindSwordfish(self):
+        # Arrange
+        # in columns 1, 4 and 7 of a 9x9 sudoku the number 5 is only a candidate in rows 0, 3 and 6
+        dimension = 9
+        dut = BaseSudoku( dimension, self.createCell, 'Test')
+        places = { 1: (0, 3), 4: (3, 6), 7: (0, 6) }
+        for column, rows in places.items():
+            for row in range(dimension):
+                if row not in rows:
+                    dut.sudoku[row][column].Remove(5)
+        dut.DoChange()
+
+        # Act
+        dut.FindSwordfish()
+
+        # Assert
+        self.assertNotIn(5, dut.sudoku[0][0].NewCandidates)
+        self.assertNotIn(5, dut.sudoku[3][8].NewCandidates)
+        self.assertNotIn(5, dut.sudoku[6][5].NewCandidates)
+        self.assertFalse(dut.sudoku[0][1].Changed)
+        self.assertFalse(dut.sudoku[1][0].Changed)
+
     def create4x4TestSudoku(self, dimension, createCell, change=True):
         # 4x4 sudoku for test
         #    Sudoku     Candidates  
@@ -0,0 +1,69 @@
+import io
+import unittest
+
+from batch import batchSolver
+from normal import normal
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestBatchSolver(unittest.TestCase):
+
+    def createPuzzles(self):
+        return [ normal.lineFromSudoku(normal.createSudoku3())
+               , '12..' + '..3.' + '..4.' + '....'  # no solution
+               , '11..' + '....' + '....' + '....'  # same number twice in row 0
+               , '12x.' + '....' + '....' + '....'  # bad symbol
+               , '.'*16 ]
+
+    def testSolveBatchInOneProcess(self):
+        # Arrange
+        puzzles = self.createPuzzles()
+
+        # Act
+        result = list(batchSolver.SolveBatch(puzzles, workers=1, chunkSize=2))
+
+        # Assert
+        self.assertEqual([0, 1, 2, 3, 4], [r.Index for r in result])
+        self.assertEqual([batchSolver.SOLVED, batchSolver.NO_SOLUTION, batchSolver.INVALID, batchSolver.INVALID, batchSolver.SOLVED]
+                        , [r.Status for r in result])
+        self.assertTrue(normal.createSudokuFromLine(result[0].Solution).Solved)
+        self.assertIsNone(result[1].Solution)
+
+    def testNoSolutionWithMaxNodes(self):
+        # Arrange
+        # 1 has no place in cell 0 of the first row
+        noSolution = '.23456789' + '1........' + '.'*63
+        hard = '8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..'
+
+        for engine in ('rules', 'dlx'):
+            # Act
+            result = [r.Status for r in batchSolver.SolveBatch([noSolution, hard], engine=engine, workers=1, maxNodes=3)]
+
+            # Assert
+            self.assertEqual([batchSolver.NO_SOLUTION, batchSolver.EXHAUSTED], result)
+
+    def testSolveBatchInWorkerProcesses(self):
+        # Arrange
+        puzzles = self.createPuzzles()*3
+
+        # Act
+        result = list(batchSolver.SolveBatch(puzzles, workers=2, chunkSize=2))
+
+        # Assert
+        self.assertEqual(list(range(len(puzzles))), [r.Index for r in result])
+        self.assertEqual([r.Status for r in batchSolver.SolveBatch(puzzles, workers=1)], [r.Status for r in result])
+
+    def testWriteResults(self):
+        # Arrange
+        results = batchSolver.SolveBatch(['.'*16, '11'+'.'*14], workers=1)
+        out = io.StringIO()
+
+        # Act
+        batchSolver.WriteResults(results, out)
+
+        # Assert
+        lines = out.getvalue().splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertEqual(['0', 'solved'], lines[0].split('\t')[:2])
+        self.assertEqual(['1', 'invalid'], lines[1].split('\t')[:2])
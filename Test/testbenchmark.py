@@ -0,0 +1,44 @@
+import copy
+import json
+import unittest
+
+from benchmark import benchmark
+from normal import normal
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestBenchmark(unittest.TestCase):
+
+    def testRun(self):
+        # Act
+        result = benchmark.Run(repeat=2, names=['normal4'])
+
+        # Assert
+        self.assertEqual(['normal4'], [case['name'] for case in result['cases']])
+        steps = result['cases'][0]['steps']
+        self.assertIn('solveDlx', steps)
+        self.assertIn('findNakedPairs', steps)
+        self.assertEqual(8, steps['construct']['count']) # 4 puzzles 2 times
+        self.assertLessEqual(steps['check']['p50'], steps['check']['max'])
+        json.dumps(result) # results are JSON
+
+    def testPatternLineIsSolvable(self):
+        # Act
+        line = benchmark.PatternLine(16, 0.5, 1)
+
+        # Assert
+        self.assertEqual(128, line.count('.'))
+        self.assertTrue(normal.createSudokuFromLine(line).Solve(engine='dlx'))
+
+    def testCompare(self):
+        # Arrange
+        baseline = {'cases': [{'name': 'normal9', 'steps': {'check': {'p50': 1.0}, 'construct': {'p50': 1.0}}}]}
+        results = copy.deepcopy(baseline)
+        results['cases'][0]['steps']['check']['p50'] = 1.5
+
+        # Act
+        result = benchmark.Compare(baseline, results, 0.2)
+
+        # Assert
+        self.assertEqual([('normal9', 'check', 1.0, 1.5)], result)
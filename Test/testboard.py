@@ -0,0 +1,260 @@
+import unittest
+
+from basesudoku.board import Board
+from basesudoku.basecell import BaseCell
+from basesudoku.topology import GetTopology
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestBoard(unittest.TestCase):
+
+    def testConstructor(self):
+        # Arrange
+        dimension = 4
+
+        # Act
+        dut = Board( dimension, dimension*dimension)
+
+        # Assert
+        self.assertEqual( 16, dut.Size)
+        self.assertEqual( 0b1111, dut.candidates[15])
+        self.assertEqual( 0, dut.numbers[15])
+
+    def testCellIsViewOfBoard(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        cell = BaseCell( dimension, 2, 1, 2, dut)
+
+        # Act
+        cell.Remove(3)
+        cell.DoChange()
+
+        # Assert
+        self.assertEqual( 9, cell.index)
+        self.assertEqual( 2, dut.groups[9])
+        self.assertEqual( 0b1011, dut.candidates[9])
+
+    def testAttachKeepsState(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        cell = BaseCell( dimension, 1, 1, 0)
+        cell.SetNumber(3, True)
+
+        # Act
+        cell.Attach(dut)
+
+        # Assert
+        self.assertIs( dut, cell.board)
+        self.assertEqual( 3, dut.numbers[5])
+        self.assertTrue( cell.IsInitial)
+
+    def testSnapshotAndRestore(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        dut.SetNumber( 0, 2)
+        dut.DoChange(0)
+        snapshot = dut.Snapshot()
+        dut.Remove( 1, 1)
+        dut.SetNumber( 2, 4)
+        dut.DoChange(1)
+        dut.DoChange(2)
+
+        # Act
+        dut.Restore(snapshot)
+
+        # Assert
+        self.assertEqual( 2, dut.numbers[0])
+        self.assertEqual( 0b1111, dut.candidates[1])
+        self.assertEqual( 0, dut.numbers[2])
+
+    def testUndoToMark(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        dut.SetTopology(GetTopology(dimension))
+        dut.SetNumber( 0, 2)
+        dut.DoChange(0)
+        snapshot = dut.Snapshot()
+        mark = dut.TrailMark()
+        dut.Remove( 1, 1)
+        dut.SetNumber( 2, 4)
+        dut.DoChange(1)
+        inner = dut.TrailMark()
+        dut.DoChange(2)
+
+        # Act
+        dut.Undo(inner)
+        pending = dut.newNumbers[2]
+        dut.Undo(mark)
+
+        # Assert
+        self.assertEqual( 4, pending)
+        self.assertEqual( snapshot, dut.Snapshot())
+        self.assertEqual( [], dut.trail)
+
+    def testTrailIsOffByDefault(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        dut.TrailMark()
+        dut.Remove( 1, 1)
+
+        # Act
+        dut.EndTrail()
+        dut.Remove( 1, 2)
+
+        # Assert
+        self.assertIsNone( dut.trail)
+        self.assertIsNone( Board( dimension, dimension*dimension).trail)
+
+    def testSolvedAndChangedAreCounted(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        dut.SetNumber( 0, 2, True)
+        dut.Remove( 1, 1)
+        dut.SetNumber( 2, 4)
+        changed = dut.Changed
+
+        # Act
+        dirty = dut.TakeDirty()
+        for i in dirty:
+            dut.DoChange(i)
+
+        # Assert
+        self.assertTrue( changed)
+        self.assertEqual( [1, 2], dirty)
+        self.assertFalse( dut.Changed)
+        self.assertEqual( 14, dut.unsolved)
+        self.assertFalse( dut.Solved)
+
+    def testPlacingUsedNumberIsContradiction(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        dut.SetTopology(GetTopology(dimension))
+        dut.SetNumber( 0, 2, True)
+        dut.SetNumber( 5, 3)
+        dut.SetNumber( 6, 3)
+        dut.DoChange(5)
+        beforeDoChange = dut.Contradiction
+
+        # Act
+        dut.DoChange(6)
+
+        # Assert
+        # cell 5 is in group 0 with cell 0 and in row 1 with cell 6
+        self.assertFalse( beforeDoChange)
+        self.assertTrue( dut.Contradiction)
+        self.assertTrue( dut.Conflicts( 1, 2))
+
+    def testEmptiedCellStaysEmpty(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        for n in range(1, dimension+1):
+            dut.Remove( 3, n)
+        dut.Remove( 3, 1)
+
+        # Act
+        dut.DoChange(3)
+
+        # Assert
+        self.assertEqual( 0, dut.candidates[3])
+        self.assertTrue( dut.Contradiction)
+
+    def testCopyIsIndependent(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+
+        # Act
+        copy = dut.Copy()
+        copy.SetNumber( 0, 1)
+        copy.DoChange(0)
+
+        # Assert
+        self.assertEqual( 1, copy.numbers[0])
+        self.assertEqual( 0, dut.numbers[0])
+
+    def testPositionsOfSetTopology(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        dut.SetNumber( 1, 3, True)
+        dut.Remove( 6, 2)
+        dut.DoChange(6)
+
+        # Act
+        dut.SetTopology(GetTopology(dimension))
+
+        # Assert
+        # row 0 has 3 in cell 1, row 1 lost candidate 2 in cell 6, position 2 in the row
+        self.assertEqual( 0b1101, dut.Positions(0, 1))
+        self.assertEqual( 0b1101, dut.Positions(0, 3))
+        self.assertEqual( 0b1011, dut.Positions(1, 2))
+        self.assertEqual( 0b1111, dut.Positions(1, 4))
+        self.assertEqual( 0b0100, dut.Used(0))
+
+    def testPositionsFollowRemove(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        dut.SetTopology(GetTopology(dimension))
+        row0 = 0
+        column1 = dimension + 1
+
+        # Act
+        positionsBefore = dut.Positions(row0, 2)
+        dut.Remove( 0, 2)
+        dut.Remove( 2, 2)
+        positionsAfter = dut.Positions(row0, 2)
+        columnPositions = dut.Positions(column1, 2)
+
+        # Assert
+        self.assertEqual( 0b1111, positionsBefore)
+        self.assertEqual( 0b1010, positionsAfter)
+        self.assertEqual( 0b1111, columnPositions)
+
+    def testNewNumberIsOnlyUnitCandidate(self):
+        # Arrange
+        dimension = 4
+        dut = Board( dimension, dimension*dimension)
+        dut.SetTopology(GetTopology(dimension))
+        row0 = 0
+
+        # Act
+        dut.SetNumber( 1, 3)
+        positionsPending1 = dut.Positions(row0, 1)
+        positionsPending3 = dut.Positions(row0, 3)
+        usedPending = dut.Used(row0)
+        dut.DoChange(1)
+        positionsSolved3 = dut.Positions(row0, 3)
+        usedSolved = dut.Used(row0)
+
+        # Assert
+        # the cell at position 1 only has 3 as unit candidate, until 3 is used
+        self.assertEqual( 0b1101, positionsPending1)
+        self.assertEqual( 0b1111, positionsPending3)
+        self.assertEqual( 0, usedPending)
+        self.assertEqual( 0b1101, positionsSolved3)
+        self.assertEqual( 0b0100, usedSolved)
+
+    def testCountersCountChangesOnce(self):
+        # Arrange
+        dut = Board(4, 16)
+
+        # Act
+        dut.Remove(0, 1)
+        dut.Remove(0, 1) # already removed
+        dut.Remove(0, 2)
+        dut.SetNumber(1, 3)
+        dut.SetNumber(1, 3) # same new number
+        dut.SetNumber(2, 4, True) # initial numbers aren't counted
+
+        # Assert
+        self.assertEqual((2, 1, 2), dut.Counters)
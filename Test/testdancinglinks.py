@@ -0,0 +1,56 @@
+import unittest
+
+from basesudoku.dancingLinks import DancingLinks
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestDancingLinks(unittest.TestCase):
+
+    def createKnuthExample(self):
+        # Exact cover example from Knuth, "Dancing Links", solution is rows 0, 3 and 4
+        links = DancingLinks(7)
+        links.AddRow([2, 4, 5])
+        links.AddRow([0, 3, 6])
+        links.AddRow([1, 2, 5])
+        links.AddRow([0, 3])
+        links.AddRow([1, 6])
+        links.AddRow([3, 4, 6])
+        return links
+
+    def testSearch(self):
+        # Arrange
+        dut = self.createKnuthExample()
+
+        # Act
+        result = dut.Search(limit=2)
+
+        # Assert
+        self.assertEqual(1, len(result))
+        self.assertEqual([0, 3, 4], sorted(result[0]))
+        self.assertEqual(0, sum(dut.covered)) # links are restored
+
+    def testSelect(self):
+        # Arrange
+        dut = self.createKnuthExample()
+
+        # Act
+        resultSelect = dut.Select(3)
+        resultConflict = dut.Select(1)
+
+        # Assert
+        self.assertTrue(resultSelect)
+        self.assertFalse(resultConflict) # row 1 covers column 0 too
+        self.assertEqual([[0, 4]], [sorted(rows) for rows in dut.Search()])
+
+    def testSearchNoSolution(self):
+        # Arrange
+        dut = DancingLinks(3)
+        dut.AddRow([0, 1])
+        dut.AddRow([1, 2])
+
+        # Act
+        result = dut.Search()
+
+        # Assert
+        self.assertEqual([], result)
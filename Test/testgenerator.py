@@ -0,0 +1,126 @@
+import unittest
+
+from generator import generator
+from generator.generator import Layout
+from normal import normal
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestGenerator(unittest.TestCase):
+
+    def createShape(self):
+        return [[0,0,1,1],
+                [0,0,1,1],
+                [2,3,3,3],
+                [2,2,2,3]]
+
+    def testGeneratedPuzzleIsUnique(self):
+        # Arrange
+        layouts = [Layout('normal', 4), Layout('normal', 9), Layout('jigsaw', 4, self.createShape())]
+
+        for layout in layouts:
+            # Act
+            result = generator.Generate(layout, 0, 7)
+            sudoku = layout.Parse(result.Line)
+            solution = layout.Parse(result.Solution)
+
+            # Assert
+            self.assertEqual(1, sudoku.CountSolutions(engine='dlx')[0])
+            self.assertTrue(solution.Solved and solution.Check())
+            for cell, solved in zip(sudoku.Cells, solution.Cells):
+                self.assertIn(cell.Number, (0, solved.Number))
+            self.assertEqual(result.Clues, len([cell for cell in sudoku.Cells if cell.Solved]))
+
+    def testSameSeedSamePuzzle(self):
+        # Arrange
+        layout = Layout('normal', 9)
+
+        # Act
+        first = generator.Generate(layout, 3, 'seed')
+        second = generator.Generate(layout, 3, 'seed')
+        other = generator.Generate(layout, 4, 'seed')
+
+        # Assert
+        self.assertEqual(first.Line, second.Line)
+        self.assertNotEqual(first.Line, other.Line)
+
+    def testGrade(self):
+        # Arrange
+        layout = Layout('normal', 9)
+        easy = normal.lineFromSudoku(normal.createSudoku1())
+        # the rules can't solve it without search
+        hard = '8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..'
+
+        # Act
+        easyGrade, easyRules = generator.Grade(layout, easy)
+        hardGrade, hardRules = generator.Grade(layout, hard)
+
+        # Assert
+        self.assertEqual('easy', easyGrade)
+        self.assertEqual('Set single candidate as solution in cells', easyRules[0])
+        self.assertEqual(generator.EXPERT, hardGrade)
+
+    def testGenerateWithGrade(self):
+        # Arrange
+        layout = Layout('normal', 4)
+
+        # Act
+        result = generator.Generate(layout, 0, 1, grade='easy')
+
+        # Assert
+        self.assertEqual('easy', result.Grade)
+        self.assertFalse(result.Missed)
+
+    def testGenerateMissesGrade(self):
+        # Arrange
+        # 4x4 sudokus are solved by the cheap rules
+        layout = Layout('normal', 4)
+
+        # Act
+        result = generator.Generate(layout, 0, 1, grade='hard', attempts=2)
+        anyGrade = generator.Generate(layout, 0, 1)
+
+        # Assert
+        self.assertEqual('hard', result.Target)
+        self.assertTrue(result.Missed)
+        self.assertFalse(anyGrade.Missed)
+
+    def testGenerateBatch(self):
+        # Arrange
+        layout = Layout('normal', 4)
+
+        # Act
+        result = list(generator.GenerateBatch(layout, 5, seed=2, workers=1))
+        pooled = list(generator.GenerateBatch(layout, 5, seed=2, workers=2, chunkSize=2))
+
+        # Assert
+        self.assertEqual(list(range(5)), [puzzle.Index for puzzle in result])
+        self.assertEqual([puzzle.Line for puzzle in result], [puzzle.Line for puzzle in pooled])
+
+    def testBadAttemptsFail(self):
+        # Arrange
+        layout = Layout('normal', 4)
+
+        # Act, Assert
+        with self.assertRaises(ValueError):
+            generator.Generate(layout, attempts=0)
+        with self.assertRaises(ValueError):
+            list(generator.GenerateBatch(layout, 2, attempts=0, workers=2))
+
+    def testLayoutFails(self):
+        with self.assertRaises(ValueError):
+            Layout('hyper', 9)
+        with self.assertRaises(ValueError):
+            Layout('jigsaw', 4)
+        with self.assertRaises(ValueError):
+            Layout('normal', 4, self.createShape())
+
+    def testLayoutWithoutSolutionFails(self):
+        # Arrange
+        # the groups of this shape can't be filled
+        shape = [[0,0,0,1],[1,1,1,0],[2,2,3,3],[2,2,3,3]]
+
+        # Act, Assert
+        with self.assertRaises(ValueError):
+            Layout('jigsaw', 4, shape)
@@ -0,0 +1,63 @@
+import io
+import json
+import unittest
+
+from basesudoku import instrumentation
+from normal import normal
+from normal.normalSudoku import NormalSudoku
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestInstrumentation(unittest.TestCase):
+
+    def testCounterSinkInTakeStep(self):
+        # Arrange
+        dut = normal.createSudoku1()
+        sink = instrumentation.CounterSink()
+        dut.Instrument(sink)
+
+        # Act
+        while not dut.Solved:
+            dut.TakeStep()
+
+        # Assert
+        totals = sink.Totals
+        self.assertIn('FindPossibleCandidates', totals)
+        self.assertGreater(totals['FindPossibleCandidates']['eliminated'], 0)
+        # every empty cell got its number from a rule
+        placed = sum(rule['placed'] for rule in totals.values())
+        self.assertEqual(81 - 26, placed)
+        self.assertGreater(totals['SetSingleCandidatesAsnewNumber']['calls'], totals['SetSingleCandidatesAsnewNumber']['changed'])
+        self.assertGreater(sink.Yield('FindPossibleCandidates'), 0)
+
+    def testJsonLinesSinkInSolve(self):
+        # Arrange
+        dut = NormalSudoku(4)
+        dut.Set(0, 0, 1, True)
+        out = io.StringIO()
+        dut.Instrument(instrumentation.JsonLinesSink(out))
+
+        # Act
+        dut.Solve()
+
+        # Assert
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertGreater(len(records), 0)
+        self.assertEqual({'rule', 'seconds', 'eliminated', 'placed', 'touched'}, set(records[0]))
+        self.assertEqual('SetSingleCandidatesAsnewNumber', records[0]['rule'])
+
+    def testCallbackSinkAndOff(self):
+        # Arrange
+        dut = normal.createSudoku1()
+        records = []
+        dut.Instrument(instrumentation.CallbackSink(records.append))
+
+        # Act
+        dut.TakeStep()
+        dut.Instrument()
+        dut.TakeStep()
+
+        # Assert
+        self.assertEqual(1, len(records)) # the second step isn't recorded
+        self.assertEqual('SetSingleCandidatesAsnewNumber', records[0].Rule)
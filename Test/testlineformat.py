@@ -0,0 +1,46 @@
+import unittest
+
+from basesudoku import lineFormat
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestLineFormat(unittest.TestCase):
+
+    def testParseGrid(self):
+        # Arrange
+        text = '1.0G' + 'a...' + '....' + '....'
+
+        # Act
+        result = lineFormat.ParseGrid(text, 16)
+
+        # Assert
+        self.assertEqual([1, 0, 0, 16, 10], result[:5])
+        self.assertEqual(16, len(result))
+
+    def testParseGridBadSymbol(self):
+        # Act and assert
+        with self.assertRaises(ValueError):
+            lineFormat.ParseGrid('12x.', 4)
+        with self.assertRaises(ValueError):
+            lineFormat.ParseGrid('125.', 4) # 5 is out of range in 4x4
+
+    def testGridDimension(self):
+        # Act and assert
+        self.assertEqual(9, lineFormat.GridDimension('.'*81))
+        self.assertEqual(25, lineFormat.GridDimension('.'*625))
+        with self.assertRaises(ValueError):
+            lineFormat.GridDimension('.'*80)
+
+    def testBoxDimension(self):
+        # Act and assert
+        self.assertEqual(3, lineFormat.BoxDimension(9))
+        with self.assertRaises(ValueError):
+            lineFormat.BoxDimension(6)
+
+    def testFormatGrid(self):
+        # Act
+        result = lineFormat.FormatGrid([1, 0, 16, 25])
+
+        # Assert
+        self.assertEqual('1.GP', result)
@@ -0,0 +1,77 @@
+import unittest
+
+from basesudoku import numpyEngine
+from batch import pipeline
+from jigsaw import jigsaw
+from normal import normal
+from normal.normalSudoku import NormalSudoku
+from samurai import samurai
+
+if __name__ == '__main__':
+    unittest.main()
+
+@unittest.skipIf(not numpyEngine.Available(), 'NumPy is not installed')
+class TestNumpyEngine(unittest.TestCase):
+
+    def testPropagateBatch(self):
+        # Arrange
+        sudokus = [normal.createSudoku1(), normal.createSudoku3()]
+        dut = numpyEngine.Boards(sudokus)
+
+        # Act
+        dut.Propagate()
+
+        # Assert
+        # the first is solved by singles, the second needs more rules
+        self.assertEqual([True, False], dut.Solved.tolist())
+        for b in range(len(sudokus)):
+            sudokus[b].Solve()
+            solution = [cell.Number for cell in sudokus[b].Cells]
+            found = dut.Numbers[b].tolist()
+            self.assertTrue(all(found[i] in (0, solution[i]) for i in range(len(found))))
+
+    def testPropagateFindsContradiction(self):
+        # Arrange
+        # no number fits cell [0][2]
+        sudokus = [normal.createSudokuFromLine('12..' + '..3.' + '..4.' + '....'), NormalSudoku(4)]
+        dut = numpyEngine.Boards(sudokus)
+
+        # Act
+        dut.Propagate()
+
+        # Assert
+        self.assertEqual([True, False], dut.Contradiction.tolist())
+
+    def testEliminate(self):
+        # Arrange
+        dut = numpyEngine.Boards([normal.createSudokuFromLine('1...' + '....' + '....' + '....')])
+
+        # Act
+        dut.Eliminate()
+
+        # Assert
+        self.assertEqual(0b1110, dut.Candidates[0][1])  # row 0
+        self.assertEqual(0b1110, dut.Candidates[0][5])  # group 0
+        self.assertEqual(0b1111, dut.Candidates[0][10])
+
+    def testSolveJigsawAndSamurai(self):
+        # Arrange
+        sudokus = [jigsaw.createSudoku(), samurai.createSudoku()]
+
+        # Act
+        result = [sudoku.Solve(engine='numpy') for sudoku in sudokus]
+
+        # Assert
+        self.assertEqual([True, True], result)
+        self.assertTrue(all(sudoku.Solved and sudoku.Check() for sudoku in sudokus))
+
+    def testPipelineStage(self):
+        # Arrange
+        lines = [normal.lineFromSudoku(normal.createSudoku3()), '12..' + '..3.' + '..4.' + '....', '.'*16]
+        stages = [pipeline.Parse, pipeline.Propagate, pipeline.Solve, pipeline.Serialize]
+
+        # Act
+        result = list(pipeline.Pipeline(pipeline.Puzzles(lines), *stages))
+
+        # Assert
+        self.assertEqual([pipeline.SOLVED, pipeline.NO_SOLUTION, pipeline.SOLVED], [puzzle.Status for puzzle in result])
@@ -0,0 +1,59 @@
+import functools
+import unittest
+
+from batch import pipeline
+from jigsaw import jigsaw
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestPipeline(unittest.TestCase):
+
+    def testPipelineIsLazy(self):
+        # Arrange
+        read = []
+        def lines():
+            for line in ['.'*16, '11' + '.'*14, '.'*16]:
+                read.append(line)
+                yield line
+        dut = pipeline.Pipeline(pipeline.Puzzles(lines()), pipeline.Parse, pipeline.Validate, pipeline.Solve, pipeline.Serialize)
+
+        # Act
+        first = next(dut)
+
+        # Assert
+        self.assertEqual(1, len(read)) # only the first line is read
+        self.assertEqual(pipeline.SOLVED, first.Status)
+        self.assertIsNone(first.Sudoku) # serialize lets go of the sudoku
+        self.assertEqual([pipeline.INVALID, pipeline.SOLVED], [puzzle.Status for puzzle in dut])
+
+    def testPipelineWithoutValidate(self):
+        # Arrange
+        # same number twice in row 0 is found by the solver too
+        puzzles = pipeline.Puzzles(['11' + '.'*14])
+
+        # Act
+        result = list(pipeline.Pipeline(puzzles, pipeline.Parse, pipeline.Solve))
+
+        # Assert
+        self.assertEqual(pipeline.NO_SOLUTION, result[0].Status)
+        self.assertIsNotNone(result[0].Sudoku) # no serialize stage
+
+    def testPipelineWithOwnStage(self):
+        # Arrange
+        line = '..3.4......1.4.. AABBAABBCCDDCCDD'
+        def keepOnlyUnsolved(puzzles):
+            for puzzle in puzzles:
+                if not puzzle.Sudoku.Solved:
+                    yield puzzle
+        stages = [ functools.partial(pipeline.Parse, parse=jigsaw.createSudokuFromLine), keepOnlyUnsolved
+                 , functools.partial(pipeline.Solve, engine='rules')
+                 , functools.partial(pipeline.Serialize, serialize=jigsaw.lineFromSudoku)]
+
+        # Act
+        result = list(pipeline.Pipeline(pipeline.Puzzles([line], 7), *stages))
+
+        # Assert
+        self.assertEqual(7, result[0].Index)
+        self.assertEqual(pipeline.SOLVED, result[0].Status)
+        self.assertTrue(result[0].Solution.endswith(' AABBAABBCCDDCCDD'))
@@ -0,0 +1,113 @@
+import unittest
+
+from basesudoku import instrumentation
+from basesudoku.rulePipeline import Rule, RulePipeline
+from normal import normal
+from normal.normalSudoku import NormalSudoku
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestRulePipeline(unittest.TestCase):
+
+    def testRulesAreOrderedByCost(self):
+        # Arrange
+        dut = NormalSudoku(4)
+
+        # Act
+        result = [rule.Cost for rule in dut.Pipeline.Rules]
+
+        # Assert
+        self.assertEqual(sorted(result), result)
+        self.assertEqual('Set single candidate as solution in cells', dut.Pipeline.Rules[0].Name)
+
+    def testExpensiveRulesOnlyWhenCheapRulesStall(self):
+        # Arrange
+        # the easy sudoku is solved by the cheap rules
+        dut = normal.createSudoku1()
+        sink = instrumentation.CounterSink()
+        dut.Instrument(sink)
+
+        # Act
+        result = dut.Pipeline.Run()
+
+        # Assert
+        self.assertTrue(result)
+        self.assertTrue(dut.Solved)
+        self.assertNotIn('FindNakedPairsRow', sink.Totals)
+
+    def testStepTexts(self):
+        # Arrange
+        dut = normal.createSudoku1()
+
+        # Act
+        first = dut.TakeStep()
+        second = dut.TakeStep()
+        third = dut.TakeStep()
+        while not dut.Solved:
+            dut.TakeStep()
+        done = dut.TakeStep()
+
+        # Assert
+        self.assertEqual('Set single candidate as solution in cells, no', first)
+        self.assertEqual('Find possible candidates, yes', second)
+        self.assertEqual('Update sudoku', third)
+        self.assertEqual('Done, solved', done)
+
+    def testStepTellsContradiction(self):
+        # Arrange
+        # 1 is removed from all cells of row 0, so it has no place in the row
+        dut = NormalSudoku(4)
+        for c in range(4):
+            dut.GetCell(0, c).Remove(1)
+        contradictionWithoutNumber = dut.Contradiction
+
+        # Act
+        result = dut.TakeStep()
+
+        # Assert
+        self.assertTrue(contradictionWithoutNumber)
+        self.assertTrue(result.startswith('Sudoku is bad'))
+        self.assertFalse(dut.Pipeline.Run())
+
+    def testStepChecksOnlyFirst(self):
+        # Arrange
+        dut = normal.createSudoku1()
+        check = dut.Check
+        checks = []
+        dut.Check = lambda: checks.append(1) or check()
+
+        # Act
+        while not dut.Solved:
+            dut.TakeStep()
+
+        # Assert
+        self.assertEqual(1, len(checks))
+        self.assertTrue(dut.Check())
+
+    def testStalledStartsOver(self):
+        # Arrange
+        dut = NormalSudoku(4)
+        dut.FindPossibleCandidates() # nothing to find in an empty sudoku
+        steps = len(dut.Pipeline.Rules)
+
+        # Act
+        result = [dut.TakeStep() for s in range(steps)]
+
+        # Assert
+        self.assertTrue(result[-1].endswith(', no rule finds more'))
+        self.assertEqual(0, dut.GetState())
+
+    def testAdaptiveOrdersByYield(self):
+        # Arrange
+        dut = normal.createSudoku1()
+        pipeline = RulePipeline(dut, [Rule('Cheap', lambda: None, 1), Rule('Candidates', dut.FindPossibleCandidates, 2)], True)
+
+        # Act
+        pipeline.Run()
+
+        # Assert
+        # the rule doing nothing has no yield and goes last
+        self.assertEqual(['Candidates', 'Cheap'], [rule.Name for rule in pipeline.Rules])
+        self.assertGreater(pipeline.Rules[0].Yield, 0)
+        self.assertEqual(0, pipeline.Rules[1].Yield)
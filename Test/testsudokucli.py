@@ -0,0 +1,100 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+import sudoku
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestSudokuCli(unittest.TestCase):
+
+    def testSolveFile(self):
+        # Arrange
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write('# two puzzles\n')
+            f.write('.'*16 + '\n')
+            f.write('\n')
+            f.write('12..' + '..3.' + '..4.' + '....' + '\n')
+        out = io.StringIO()
+        err = io.StringIO()
+
+        # Act
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            result = sudoku.main(['solve', f.name])
+        os.remove(f.name)
+
+        # Assert
+        lines = out.getvalue().splitlines()
+        self.assertEqual(1, result) # not all puzzles solved
+        self.assertEqual(2, len(lines))
+        self.assertTrue(sudoku.normal.createSudokuFromLine(lines[0]).Solved)
+        self.assertEqual('nosolution', lines[1])
+        self.assertIn('Solved 1 of 2 puzzles', err.getvalue())
+
+    def testGenerate(self):
+        # Arrange
+        out = io.StringIO()
+        err = io.StringIO()
+
+        # Act
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            result = sudoku.main(['generate', '--dimension', '4', '--count', '2', '--seed', '5', '--show-grade'])
+
+        # Assert
+        lines = out.getvalue().splitlines()
+        self.assertEqual(0, result)
+        self.assertEqual(2, len(lines))
+        line, grade = lines[0].split('\t')
+        self.assertEqual(1, sudoku.normal.createSudokuFromLine(line).CountSolutions()[0])
+        self.assertEqual('easy', grade)
+        self.assertIn('Generated 2 puzzles', err.getvalue())
+
+    def testGenerateTellsMissedGrade(self):
+        # Arrange
+        out = io.StringIO()
+        err = io.StringIO()
+
+        # Act
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            result = sudoku.main(['generate', '--dimension', '4', '--count', '2', '--grade', 'hard', '--attempts', '1'])
+
+        # Assert
+        self.assertEqual(1, result)
+        self.assertEqual(2, len(out.getvalue().splitlines()))
+        self.assertIn('Warning: 2 puzzles are not hard', err.getvalue())
+
+    def testBadWorkersOrAttempts(self):
+        # Arrange
+        err = io.StringIO()
+
+        # Act
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(err), \
+             unittest.mock.patch('sys.stdin', io.StringIO('.'*16 + '\n')):
+            solved = sudoku.main(['solve', '--workers', '0'])
+            generated = sudoku.main(['generate', '--dimension', '4', '--workers', '0'])
+            noAttempts = sudoku.main(['generate', '--dimension', '4', '--attempts', '0'])
+
+        # Assert
+        self.assertEqual([2, 2, 2], [solved, generated, noAttempts])
+        self.assertIn("Can't generate: Attempts must be positive", err.getvalue())
+        self.assertIn("Can't solve: Workers must be positive", err.getvalue())
+        self.assertIn("Can't generate: Workers must be positive", err.getvalue())
+
+    def testSolveImportsOnlySolverModules(self):
+        # Arrange
+        modules = "('tkinter', 'numpy', 'generator.generator')"
+        code = "import sys, sudoku; sudoku.main(['solve']); print(any(m in sys.modules for m in %s))" % modules
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        # Act
+        result = subprocess.run([sys.executable, '-c', code], cwd=root, input='.'*16 + '\n'
+                                , capture_output=True, text=True)
+
+        # Assert
+        self.assertEqual('False', result.stdout.splitlines()[-1])
@@ -0,0 +1,92 @@
+import unittest
+
+from basesudoku.topology import GetTopology, GetSamuraiTopology
+from normal.normalSudoku import NormalSudoku
+from jigsaw.jigsawSudoku import JigsawSudoku
+
+if __name__ == '__main__':
+    unittest.main()
+
+class TestTopology(unittest.TestCase):
+
+    def testNormalPeers(self):
+        # Arrange
+        dimension = 9
+
+        # Act
+        dut = GetTopology(dimension)
+
+        # Assert
+        # 20 peers: 8 in row, 8 in column and 4 more in the square
+        self.assertEqual( 81, dut.Size)
+        self.assertEqual( 27, len(dut.Units))
+        self.assertEqual( 20, len(dut.Peers[0]))
+        self.assertNotIn( 0, dut.Peers[0])
+        self.assertIn( 20, dut.Peers[0]) # row 2, column 2 is in the upper left square
+        self.assertEqual( (0, 9, 18), dut.CellUnits[0])
+
+    def testSharedBySudokusOfSameShape(self):
+        # Arrange
+        dimension = 4
+
+        # Act
+        sudoku1 = NormalSudoku(dimension)
+        sudoku2 = NormalSudoku(dimension)
+
+        # Assert
+        self.assertIs( sudoku1.Topology, sudoku2.Topology)
+        self.assertIs( GetTopology(dimension), sudoku1.Topology)
+
+    def testJigsawGroups(self):
+        # Arrange
+        dimension = 4
+        shape = [[0,0,1,1],
+                 [0,0,1,1],
+                 [2,3,3,3],
+                 [2,2,2,3]]
+
+        # Act
+        dut = JigsawSudoku(dimension, shape).Topology
+
+        # Assert
+        self.assertEqual( (8, 12, 13, 14), dut.Groups[2])
+        self.assertEqual( 3, dut.Group(2, 1))
+        self.assertIs( dut, GetTopology(dimension, shape))
+
+    def testIntersections(self):
+        # Arrange
+        dimension = 4
+        shape = [[0,0,1,1],
+                 [0,0,1,1],
+                 [2,3,3,3],
+                 [2,2,2,3]]
+
+        # Act
+        normalTopology = GetTopology(9)
+        jigsawTopology = JigsawSudoku(dimension, shape).Topology
+
+        # Assert
+        # a square meets 3 rows and 3 columns in 3 cells
+        self.assertEqual( 9*6, len(normalTopology.Intersections))
+        self.assertIn( (18, 0, 0b111, 0b111), normalTopology.Intersections)
+        # group 2 (8, 12, 13, 14) meets row 3 (12, 13, 14, 15) in 3 cells and column 0 in 2
+        group2 = 2*dimension + 2
+        self.assertIn( (group2, 3, 0b1110, 0b0111), jigsawTopology.Intersections)
+        self.assertIn( (group2, dimension, 0b0011, 0b1100), jigsawTopology.Intersections)
+
+    def testSamuraiSharedCells(self):
+        # Arrange
+        dimension = 4
+        grid = 5
+
+        # Act
+        dut = GetSamuraiTopology(dimension, grid)
+
+        # Assert
+        # five grids of 16 cells share four groups of 4 cells
+        self.assertEqual( 5*16 - 4*4, dut.Size)
+        self.assertEqual( 5*3*4 - 4, len(dut.Units))
+        # lower right cell of grid 0 is upper left cell in the middle group 2
+        self.assertEqual( dut.CellIds[0][15], dut.CellIds[2][5])
+        self.assertEqual( dut.CellIds[4][0], dut.CellIds[2][10])
+        self.assertNotEqual( dut.CellIds[0][0], dut.CellIds[2][0])
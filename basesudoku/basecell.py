@@ -1,24 +1,52 @@
 import math
 
+from basesudoku.board import Board, CHANGED, INITIAL, MARKED
+
+def CandidateBit(n):
+    # bit for candidate n, candidate 1 is bit 0, candidate 2 is bit 1, and so forth
+    return 1 << (n-1)
+
+def CandidatesFromMask(mask):
+    # list of candidates in increasing order from a candidate bitmask
+    result = []
+    while mask:
+        low = mask & -mask # lowest bit set
+        result.append(low.bit_length())
+        mask ^= low
+    return result
+
+def CountCandidates(mask):
+    return bin(mask).count('1')
+
 class BaseCell:
-    def __init__(self, dim, row, col, group):
-        self.number = 0 # 0 means not solved, 1 - n means solved
-        self.dimension = dim # 4=2x2, 9=3x3, 16=4x4, 25=5x5 ...
-        self.row=row # row and column are 0 based
-        self.column=col
-        self.newNumber = 0 # new number when changed
-        self.newCandidates = [] # new candidates when changed
-        self.candidates = []
-        for col in range(1, 1+self.dimension):
-            self.candidates.append(col)
-        self.group = group
-        self.changed = False # ?
-        self.isInitial = False # is true, when the number is given for the puzzle
-        self.isMarked = False # True when the cell is marked like belonging to a pair
+    # A cell is a view of one cell id in a board, see Board. A cell constructed
+    # without a board holds its own board of one cell.
+    __slots__ = ('board', 'index', 'row', 'column')
+
+    def __init__(self, dim, row, col, group, board=None):
+        # dim: 4=2x2, 9=3x3, 16=4x4, 25=5x5 ...
+        # row and column are 0 based
+        if board is None:
+            board = Board(dim, 1)
+            index = 0
+        else:
+            index = row*dim + col
+        self.board = board
+        self.index = index
+        self.row = row
+        self.column = col
+        board.groups[index] = group
+
+    def Attach(self, board):
+        # Moves the cell into a sudoku's board keeping its state
+        index = self.row*board.dimension + self.column
+        board.Attach(index, self.board, self.index)
+        self.board = board
+        self.index = index
 
     @property
     def Dimension(self):
-        return self.dimension
+        return self.board.dimension
 
     @property
     def Row(self):
@@ -30,11 +58,11 @@ class BaseCell:
 
     @property
     def Group(self):
-        return self.group
+        return self.board.groups[self.index]
     
     @property
     def Number(self):
-        return self.number
+        return self.board.numbers[self.index]
 
     @Number.setter
     def Number(self, n): # It doesn't work for inherited class calling base class property?
@@ -42,121 +70,83 @@ class BaseCell:
 
     def SetNumber(self, n, isInitial=False):
         # Assigning to Number means the cell is marked changed and newNumber holds the solution for the cell
-        if 0 < n and n <= self.dimension:
-            if isInitial:
-                # Initital number is used, when the sudoku is cleared for retry
-                self.isInitial = isInitial
-                self.number = n
-            else:
-                self.newNumber = n
-                # clear list of candidates and set the only one
-                self.candidates.clear()
-                self.newCandidates.clear()
-                self.changed = True
-        else:
-            raise ValueError            
+        self.board.SetNumber(self.index, n, isInitial)
 
     @property
     def NewNumber(self):
         result = 0
-        if self.changed:
-            result = self.newNumber
+        if self.Changed:
+            result = self.board.newNumbers[self.index]
         return result
 
     @property
     def Solved(self):
-        return self.number != 0
+        return self.board.numbers[self.index] != 0
 
     @property
     def IsInitial(self):
-        return self.isInitial
+        return self.board.flags[self.index] & INITIAL != 0
 
     @property
     def Changed(self):
-        return self.changed
+        return self.board.flags[self.index] & CHANGED != 0
     
     @property
     def IsMarked(self):
-        return self.isMarked
+        return self.board.flags[self.index] & MARKED != 0
 
     def Mark(self):
-        self.isMarked = True
+        self.board.Mark(self.index)
 
     def DoChange(self):
-        # Sets the solution, when newNumber holds a solution and clears list of candidates
+        # Sets the solution, when newNumber holds a solution and clears candidates
         # Clears temporary variables newNumber and newCandidates and changed flag
-        self.isMarked = False
-        if not self.Solved and self.changed:
-            if self.newNumber != 0:
-                self.number = self.newNumber
-                self.candidates.clear()
-            # Refactor: Can I avoid the copy and clear lists of candidates and newCandidates?
-            if self.newCandidates != []:
-                self.candidates.clear()
-                self.candidates = self.newCandidates.copy()
-            self.newCandidates.clear()
-            self.newNumber = 0
-            self.changed = False
+        self.board.DoChange(self.index)
 
     def SetSingleCandidateToNewNumber(self):
-        if len(self.candidates) == 1:
-            # only one candidate left, set cell newNumber and flag changed
-            if self.candidates[0] != 0:
-                self.newNumber = self.candidates[0]
-                self.changed = True
-            else:
-                raise ValueError
+        self.board.SetSingleCandidateToNewNumber(self.index)
 
     @property
-    def Candidates(self):
-        result = []
-        if not self.Solved:            
-            result = self.candidates
+    def CandidateMask(self):
+        result = 0
+        if not self.Solved:
+            result = self.board.candidates[self.index]
         return result
 
+    @property
+    def NewCandidateMask(self):
+        return self.board.newCandidates[self.index]
+
+    @property
+    def Candidates(self):
+        return CandidatesFromMask(self.CandidateMask)
+
     @property
     def NewCandidates(self):
-        return self.newCandidates
+        return CandidatesFromMask(self.NewCandidateMask)
+
+    def HasCandidate(self, candidate):
+        # Use newCandidates, when changed, because another rule may have removed candidates
+        return self.board.CurrentCandidates(self.index) & CandidateBit(candidate) != 0
 
     def Remove(self, candidateToRemove):
-        if 0 < candidateToRemove and candidateToRemove <= self.dimension:
-            if not self.Solved:
-                if (not self.changed) or self.newCandidates == []:
-                    self.newCandidates = self.candidates.copy() # copy so new candidates are a new list object
-                if candidateToRemove in self.newCandidates:
-                    self.changed = True
-                    self.newCandidates.remove(candidateToRemove)
-        else:
-            raise ValueError
+        self.board.Remove(self.index, candidateToRemove)
         
     def AppendSingleCandidates(self, singleCandidates):
         # Append new single candidates in the cell to the list of single candidates
         # Don't append when already solved.
-        if not self.Solved:
-            # Find unique singleCandidates from candidates, when cell isn't changed,
-            # otherwise use newCandidates, because another FindSingles algorithm
-            # may have changed the candidates to a single candidate.
-            candidates = self.candidates
-            if self.changed:
-                candidates = self.newCandidates
-            for candidate in candidates:
-                if not candidate in singleCandidates:
-                    singleCandidates.append(candidate)
+        # Find unique singleCandidates from candidates, when cell isn't changed,
+        # otherwise use newCandidates, because another FindSingles algorithm
+        # may have changed the candidates to a single candidate.
+        for candidate in CandidatesFromMask(self.board.CurrentCandidates(self.index)):
+            if not candidate in singleCandidates:
+                singleCandidates.append(candidate)
         return singleCandidates
     
     def CountAndSetFirstCellForSingleCandidate(self, singleCandidate, count, firstCell):
         # Jump over solved cells.
-        candidates = self.candidates
-        if self.changed:
-            candidates = self.newCandidates
-        if (not self.Solved) and singleCandidate in candidates:
+        if self.HasCandidate(singleCandidate):
             count += 1
             if count==1:
                 firstCell = self  # return this as first just in case it's the only one
         return (count, firstCell)
-    
-
-
-    
-
-
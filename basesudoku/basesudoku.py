@@ -1,20 +1,54 @@
 import math
 
-class BaseSudoku:
-    def __init__(self, dimension, createCell, type):
+from basesudoku.board import Board
+from basesudoku.topology import GetTopologyForGroups
+from basesudoku.sudokuDriver import SudokuDriver
+from basesudoku.rulePipeline import Rule
+from basesudoku.subsets import Subsets
+from basesudoku.basecell import CountCandidates
+
+class BaseSudoku(SudokuDriver):
+    def __init__(self, dimension, createCell, type, topology=None):
         self.dimension = dimension # = rho*rho
         self.type = type # Enumeration: ('Normal', 'Jigsaw', 'Hyper', 'Samurai', 'X' )
+        # The state of all cells is held in the board, the cells are views of it.
+        # createCell(dimension, row, column, board) creates the cell in the board, a cell
+        # made in a board of its own is attached to it.
+        self.board = Board(dimension, dimension*dimension)
+        self.boards = [self.board] # see SudokuDriver
+        self.sinks = [] # sinks of the rule instrumentation, see Instrument
+        self.pipeline = None # made from Rules on first use, see Pipeline
         self.sudoku = []  # the sudoku arranged by rows and columns
-        self.groups = []  # the soudoku arranged by groups
-        for g in range(self.dimension):
-            self.groups.append([])
+        self.cells = []   # the sudoku arranged by cell id, row*dimension + column
         for r in range(self.dimension):
             row = []            
             for c in range(self.dimension):
-                cell = createCell(self.dimension, r, c)
-                self.groups[cell.Group].append(cell)
+                cell = createCell(self.dimension, r, c, self.board)
+                if cell.board is not self.board:
+                    cell.Attach(self.board)
                 row.append( cell )
+                self.cells.append( cell )
             self.sudoku.append(row)
+        # Units and peers are shared by all sudokus of the same shape
+        if topology is None:
+            topology = GetTopologyForGroups(dimension, self.board.groups)
+        self.topology = topology
+        self.board.SetTopology(topology)
+        self.groups = []  # the soudoku arranged by groups
+        for group in self.topology.Groups:
+            self.groups.append([self.cells[i] for i in group])
+
+    @property
+    def Topology(self):
+        return self.topology
+
+    @property
+    def Cells(self):
+        return self.cells
+
+    @property
+    def Board(self):
+        return self.board
 
     @property
     def Dimension(self):
@@ -26,94 +60,81 @@ class BaseSudoku:
     
     @property
     def Solved(self):
-        result = True
-        for r in range(self.dimension):
-            for c in range(self.dimension):
-                result = result and self.sudoku[r][c].Solved
-                if not result:
-                    break
-            if not result:
-                break
-        return result
+        # Counted by the board, see Board.SetSolution
+        return self.board.Solved
     
     @property
     def Changed(self):
-        result = False
-        for r in range(self.dimension):
-            for c in range(self.dimension):
-                result = result or self.sudoku[r][c].Changed
-                if result:
-                    break
-            if result:
-                break
-        return result
+        return self.board.Changed
 
     def DoChange(self):
-        for r in range(self.dimension):
-            for c in range(self.dimension):
-                self.sudoku[r][c].DoChange()
-    
+        # Only the cells flagged changed or marked since the last DoChange are visited,
+        # in order of cell id like a scan of the sudoku
+        board = self.board
+        for i in sorted(set(board.TakeDirty())):
+            board.DoChange(i)
+
+    @property
+    def Contradiction(self):
+        # True when a rule has left a cell without candidates
+        return self.board.Contradiction
+
+    @property
+    def Boards(self):
+        return self.boards
 
     def CheckCellsConstrain(self, cell1, cell2):
         # returns true when one of the cells is not solved, otherwise numbers have not to be the same
         return (not cell1.Solved or not cell2.Solved) or (cell1.Number != cell2.Number)
 
+    def CheckUnits(self, units):
+        # One pass over the cells of the units, a number seen twice in a unit breaks the
+        # constraints. Placing the number is caught already, see Contradiction.
+        numbers = self.board.numbers
+        cellsOfUnits = self.topology.Units
+        for unit in units:
+            seen = 0
+            for i in cellsOfUnits[unit]:
+                if numbers[i] != 0:
+                    bit = 1 << (numbers[i]-1)
+                    if seen & bit:
+                        return False
+                    seen |= bit
+        return True
+
     def CheckRow(self):
-        result = True
-        for row in range(self.dimension):
-            for column1 in range(self.dimension-1):
-                for column2 in range(column1+1,self.dimension):
-                    result = self.CheckCellsConstrain(self.sudoku[row][column1], self.sudoku[row][column2])
-                    if not result:
-                        break
-                if not result:
-                    break
-            if not result:
-                break
-        return result
+        return self.CheckUnits(self.topology.RowUnits)
     
     def CheckColumn(self):
-        result = True
-        for column in range(self.dimension):
-            for row1 in range(self.dimension-1):
-                for row2 in range(row1+1,self.dimension):
-                    result = self.CheckCellsConstrain(self.sudoku[row1][column], self.sudoku[row2][column])
-                    if not result:
-                        break
-                if not result:
-                    break
-            if not result:
-                break
-        return result
+        return self.CheckUnits(self.topology.ColumnUnits)
 
     def CheckGroup(self):
-        result = True
-        for group in self.groups:
-            for cell1 in range(self.dimension-1):
-                for cell2 in range(cell1+1, self.dimension):
-                    result = self.CheckCellsConstrain(group[cell1], group[cell2])
-                    if not result:
-                        break
-                if not result:
-                    break
-            if not result:
-                break
-        return result
+        return self.CheckUnits(self.topology.GroupUnits)
 
     def Check(self):
         # Check sudoku's constraints are fulfilled
-        return self.CheckRow() and self.CheckColumn() and self.CheckGroup()
+        return self.CheckUnits(range(len(self.topology.Units)))
 
     def SetSingleCandidatesAsnewNumber(self):
-        for row in range( 0, self.dimension):
-            for col in range( 0, self.dimension):
-                self.sudoku[row][col].SetSingleCandidateToNewNumber()
+        # Only cells reduced to a single candidate since last call are visited
+        for i in self.board.TakeSingles():
+            self.cells[i].SetSingleCandidateToNewNumber()
 
     def GetCell(self, r, c):
         return self.sudoku[r][c]
 
     def SetCell(self, r, c, cell):
+        # Replaces the cell in row r and column c in all arrangements of the sudoku
+        if cell.board is not self.board:
+            cell.Attach(self.board)
+        i = r*self.dimension + c
+        old = self.cells[i]
         self.sudoku[r][c] = cell
+        self.cells[i] = cell
+        for group in self.groups:
+            for k in range(len(group)):
+                if group[k] is old:
+                    group[k] = cell
 
     @property
     def Sudoku(self):
@@ -131,76 +152,235 @@ class BaseSudoku:
 
     def RemoveCandidatesInColumnForNumber( self, column, number):
         # remove candidates in column
-        for row in range( 0, self.dimension):
-            self.sudoku[row][column].Remove(number)        
+        for i in self.topology.Columns[column]:
+            self.cells[i].Remove(number)        
 
     def RemoveCandidatesInRowForNumber( self, row, number):
-        # remove candidates in column
-        for column in range( 0, self.dimension):
-            self.sudoku[row][column].Remove(number)        
+        # remove candidates in row
+        for i in self.topology.Rows[row]:
+            self.cells[i].Remove(number)        
 
     def RemoveCandidatesInGroupForNumber( self, group, number):
         # remove candidates in group for normal, jigsaw and samurai sudoku
-        for cell in self.groups[group]:
-            cell.Remove(number)
-
-    def FindPossibleCandidatesBase(self, removeCandidatesHook):
-        # find solved
-        cellsSolved = []
-        for row in range( 0, self.dimension):
-            for column in range( 0, self.dimension):
-                if self.sudoku[row][column].Solved:
-                    cellsSolved.append(self.sudoku[row][column])
-
-        # remove candidates
-        for cell in cellsSolved:
-            self.RemoveCandidatesInColumnForNumber( cell.Column, cell.Number)
-            self.RemoveCandidatesInRowForNumber( cell.Row, cell.Number)
-            removeCandidatesHook( cell ) # remove from square, cross, group or other formation
+        for i in self.topology.Groups[group]:
+            self.cells[i].Remove(number)
+
+    def RemoveCandidatesInPeersForNumber( self, cell, number):
+        # remove candidates in row, column and group of the cell
+        for i in self.topology.Peers[cell.index]:
+            self.cells[i].Remove(number)
+
+    def FindPossibleCandidatesBase(self, removeCandidatesHook=None):
+        # Only cells solved since last call are visited, cells solved before have
+        # already removed their number from the candidates of their peers.
+        # Without a hook candidates are removed from the peers of solved cells,
+        # otherwise from row and column, and the hook removes from square, cross,
+        # group or other formation
+        for i in self.board.TakePlaced():
+            cell = self.cells[i]
+            if removeCandidatesHook is None:
+                self.RemoveCandidatesInPeersForNumber( cell, cell.Number)
+            else:
+                self.RemoveCandidatesInColumnForNumber( cell.Column, cell.Number)
+                self.RemoveCandidatesInRowForNumber( cell.Row, cell.Number)
+                removeCandidatesHook( cell )
+
+    def FindSinglesUnit(self, unit):
+        # The board keeps the positions of each candidate in each unit, so a candidate
+        # only appearing in one cell for the unit is found by a single bitmask test.
+        # Numbers already solved in the unit are jumped over.
+        board = self.board
+        cells = self.topology.Units[unit]
+        used = board.Used(unit)
+        for candidate in range(1, self.dimension+1):
+            positions = board.Positions(unit, candidate)
+            if positions != 0 and positions & (positions-1) == 0 and not used & (1 << (candidate-1)):
+                cell = self.cells[cells[positions.bit_length()-1]]
+                if cell.NewNumber != candidate:
+                    # The candidate only appears in one cell for the unit.
+                    cell.Number = candidate
 
     def FindSinglesColumn(self):
-        for column in range( 0, self.dimension):
-            singleCandidates = [] # list of unique candidates in the column
-            for row in range( 0, self.dimension):
-                singleCandidates = self.sudoku[row][column].AppendSingleCandidates(singleCandidates)
-            for candidate in singleCandidates:
-                count = 0
-                firstCell = None
-                for row in range( 0, self.dimension):
-                    count, firstCell = self.sudoku[row][column].CountAndSetFirstCellForSingleCandidate(candidate, count, firstCell)
-                if count == 1:
-                    # The candidate only appears in one cell for the column.
-                    firstCell.Number = candidate
+        for unit in self.topology.ColumnUnits:
+            self.FindSinglesUnit(unit)
 
     def FindSinglesRow(self):
-        for row in range( 0, self.dimension):
-            singleCandidates = []
-            for column in range( 0, self.dimension):
-                singleCandidates = self.sudoku[row][column].AppendSingleCandidates(singleCandidates)
-            for candidate in singleCandidates:
-                count = 0
-                firstCell = None
-                for column in range( 0, self.dimension):
-                    count, firstCell = self.sudoku[row][column].CountAndSetFirstCellForSingleCandidate(candidate, count, firstCell)
-                if count == 1:
-                    # The candidate only appears in one cell for the row.
-                    firstCell.Number = candidate
+        for unit in self.topology.RowUnits:
+            self.FindSinglesUnit(unit)
 
     def FindSinglesGroup(self):
-        for group in self.Groups:
-            singleCandidates = []
-            for cell in group:
-                singleCandidates = cell.AppendSingleCandidates(singleCandidates)
-            for candidate in singleCandidates:
-                count = 0
-                firstCell = None
-                for cell in group:
-                    count, firstCell = cell.CountAndSetFirstCellForSingleCandidate(candidate, count, firstCell)
-                if count == 1:
-                    # The candidate only appears in one cell for the group.
-                    firstCell.Number = candidate
+        for unit in self.topology.GroupUnits:
+            self.FindSinglesUnit(unit)
 
     def FindSinglesBase(self, setSinglesHook):
         self.FindSinglesRow()
         self.FindSinglesColumn()
-        setSinglesHook()
\ No newline at end of file
+        setSinglesHook()
+
+    def RemoveInPositions(self, unit, positions, number):
+        # Removes number from the cells at the positions in the unit
+        cells = self.topology.Units[unit]
+        while positions:
+            low = positions & -positions
+            positions ^= low
+            self.cells[cells[low.bit_length()-1]].Remove(number)
+
+    def FindLockedCandidates(self):
+        # When the places of a number in a group are all in one row or column, the number
+        # is removed from the rest of the line (pointing), and when the places in a row
+        # or column are all in one group, it is removed from the rest of the group
+        # (claiming). The intersections are kept by the topology, also for jigsaw shapes.
+        board = self.board
+        for group, line, groupPositions, linePositions in self.topology.Intersections:
+            for n in range(1, self.dimension+1):
+                inGroup = board.Positions(group, n)
+                if inGroup != 0 and inGroup & ~groupPositions == 0:
+                    self.RemoveInPositions(line, board.Positions(line, n) & ~linePositions, n)
+                inLine = board.Positions(line, n)
+                if inLine != 0 and inLine & ~linePositions == 0:
+                    self.RemoveInPositions(group, board.Positions(group, n) & ~groupPositions, n)
+
+    def FindNakedSubsetsUnit(self, unit, size):
+        # A naked subset is size cells of the unit having only size candidates together,
+        # so the candidates are in those cells and are removed from the other cells of
+        # the unit. All naked subsets of the unit are applied.
+        board = self.board
+        cells = []
+        masks = []
+        for i in self.topology.Units[unit]:
+            mask = board.CurrentCandidates(i)
+            if mask != 0 and self.cells[i].NewNumber == 0:
+                cells.append(i)
+                if CountCandidates(mask) <= size:
+                    masks.append(mask)
+                else:
+                    masks.append(board.full)
+        if len(cells) > size:
+            for indexes, union in Subsets(masks, size):
+                subset = [cells[k] for k in indexes]
+                for i in subset:
+                    self.cells[i].Mark() # for the view
+                for i in cells:
+                    if not i in subset:
+                        remove = board.CurrentCandidates(i) & union
+                        while remove:
+                            low = remove & -remove
+                            remove ^= low
+                            self.cells[i].Remove(low.bit_length())
+
+    def FindNakedSubsets(self, units, size):
+        for unit in units:
+            self.FindNakedSubsetsUnit(unit, size)
+
+    def FindNakedPairsRow(self):
+        self.FindNakedSubsets(self.topology.RowUnits, 2)
+
+    def FindNakedPairsColumn(self):
+        self.FindNakedSubsets(self.topology.ColumnUnits, 2)
+
+    def FindNakedPairsGroup(self):
+        self.FindNakedSubsets(self.topology.GroupUnits, 2)
+
+    def FindNakedTriples(self):
+        self.FindNakedSubsets(range(len(self.topology.Units)), 3)
+
+    def FindNakedQuads(self):
+        self.FindNakedSubsets(range(len(self.topology.Units)), 4)
+
+    def FindHiddenSubsetsUnit(self, unit, size):
+        # A hidden subset is size numbers having only size cells of the unit as places
+        # together, so those cells hold the numbers and lose their other candidates.
+        # Found from the positions of the numbers in the unit kept by the board.
+        board = self.board
+        numbers = []
+        masks = []
+        for n in range(1, self.dimension+1):
+            positions = board.Positions(unit, n)
+            if positions != 0:
+                numbers.append(n)
+                if CountCandidates(positions) <= size:
+                    masks.append(positions)
+                else:
+                    masks.append(board.full)
+        if len(numbers) > size:
+            cells = self.topology.Units[unit]
+            for indexes, union in Subsets(masks, size):
+                keep = 0
+                for k in indexes:
+                    keep |= 1 << (numbers[k]-1)
+                while union:
+                    low = union & -union
+                    union ^= low
+                    cell = self.cells[cells[low.bit_length()-1]]
+                    cell.Mark() # for the view
+                    remove = board.CurrentCandidates(cell.index) & ~keep
+                    while remove:
+                        bit = remove & -remove
+                        remove ^= bit
+                        cell.Remove(bit.bit_length())
+
+    def FindHiddenSubsets(self, units, size):
+        for unit in units:
+            self.FindHiddenSubsetsUnit(unit, size)
+
+    def FindHiddenPairs(self):
+        self.FindHiddenSubsets(range(len(self.topology.Units)), 2)
+
+    def FindHiddenTriples(self):
+        self.FindHiddenSubsets(range(len(self.topology.Units)), 3)
+
+    def FindFishLines(self, lines, covers, size, number):
+        # A fish is size base lines, whose places for the number are together in size
+        # cover lines crossing them, so the number is removed from the covers outside
+        # the base lines. The places are the positions of the number in the base line
+        # units, bit p of a row is column p and bit p of a column is row p.
+        board = self.board
+        bases = []
+        masks = []
+        for line in lines:
+            positions = board.Positions(line, number)
+            if positions != 0:
+                bases.append(line)
+                if CountCandidates(positions) <= size:
+                    masks.append(positions)
+                else:
+                    masks.append(board.full)
+        if len(bases) > size:
+            for indexes, union in Subsets(masks, size):
+                keep = 0
+                for k in indexes:
+                    keep |= 1 << (bases[k] - lines.start)
+                while union:
+                    low = union & -union
+                    union ^= low
+                    cover = covers[low.bit_length()-1]
+                    self.RemoveInPositions(cover, board.Positions(cover, number) & ~keep, number)
+
+    def FindFish(self, size):
+        # with rows as base lines and columns as covers and the other way round
+        rows = self.topology.RowUnits
+        columns = self.topology.ColumnUnits
+        for n in range(1, self.dimension+1):
+            self.FindFishLines(rows, columns, size, n)
+            self.FindFishLines(columns, rows, size, n)
+
+    def FindXWings(self):
+        self.FindFish(2)
+
+    def FindSwordfish(self):
+        self.FindFish(3)
+
+    def FindJellyfish(self):
+        self.FindFish(4)
+
+    def FindPossibleCandidates(self):
+        self.FindPossibleCandidatesBase()
+
+    def SetSingles(self):
+        self.FindSinglesBase(self.FindSinglesGroup)
+
+    def NakedPairRules(self):
+        # The naked pairs rules, see SudokuDriver.Rules
+        return [ Rule('Find naked pairs row wise', self.FindNakedPairsRow, 10)
+               , Rule('Find naked pairs column wise', self.FindNakedPairsColumn, 10)
+               , Rule('Find naked pairs group wise', self.FindNakedPairsGroup, 10) ]
@@ -0,0 +1,396 @@
+from array import array
+import copy
+
+# Flags held per cell in Board.flags
+CHANGED = 1  # the cell holds a new number or new candidates, see DoChange
+INITIAL = 2  # the number is given for the puzzle
+MARKED = 4   # the cell is marked like belonging to a pair
+
+class Board:
+    # Holds the state of all cells of a sudoku in flat buffers indexed by cell id.
+    # A cell id is row*dimension + column for a sudoku, BaseCell is a view of one id.
+    # Candidates are bitmasks, bit n-1 is set when n is a candidate.
+    def __init__(self, dimension, size):
+        self.dimension = dimension
+        self.size = size # number of cells
+        self.full = (1 << dimension) - 1 # all candidates
+        self.numbers = bytearray(size) # 0 means not solved, 1 - n means solved
+        self.newNumbers = bytearray(size) # new number when changed
+        self.candidates = array('L', [self.full]) * size
+        self.newCandidates = array('L', [0]) * size # new candidates when changed, 0 means none
+        self.flags = bytearray(size)
+        self.groups = bytearray(size)
+        # Work queues of cell ids for propagation. A cell id is queued in placed, when
+        # its number is set, so its peers lose the number as candidate, and in singles,
+        # when its candidates are reduced to one, so the candidate can be placed.
+        self.placed = []
+        self.singles = []
+        # Positions of candidates in units, see SetTopology
+        self.topology = None
+        self.positions = array('L')
+        self.used = array('L')
+        # True when a removal left a cell without candidates, a number is left without
+        # place in a unit, see Track, or a number is placed twice in a unit, see Use
+        self.contradiction = False
+        # Kept on each change, so Solved and Changed of a sudoku don't scan the cells
+        self.unsolved = size # number of cells without number
+        self.pending = 0     # number of cells flagged changed
+        self.dirty = []      # cell ids flagged changed or marked, see TakeDirty
+        # Counts of changes made by rules since the board was made, see Counters.
+        # They are not part of the state, so they count on over Restore.
+        self.eliminated = 0 # candidates removed
+        self.assigned = 0   # new numbers set
+        self.touched = 0    # cells flagged changed
+        # Trail of cell states before each change, see TrailMark and Undo. None means
+        # changes aren't recorded.
+        self.trail = None
+
+    # Names of the buffers holding the state of the cells, see Snapshot
+    _state = ('numbers', 'newNumbers', 'candidates', 'newCandidates', 'flags', 'placed', 'singles', 'positions', 'used', 'dirty')
+
+    def SetTopology(self, topology):
+        # From now on the positions of each candidate in each unit are kept as bitmasks,
+        # positions[unit*dimension + n-1] has bit p set, when the cell at position p in
+        # the unit has n as unit candidate, see UnitCandidates
+        self.topology = topology
+        self.cellUnits = topology.CellUnits
+        self.cellPositions = topology.CellPositions
+        # used[unit] has bit n-1 set, when n is the number of a solved cell in the unit
+        self.used = array('L', [0]) * len(topology.Units)
+        for i in range(self.size):
+            if self.numbers[i] != 0:
+                self.Use(i)
+        # copied from the positions of an empty sudoku, only the cells with a number or
+        # less candidates are tracked
+        self.positions = topology.FullPositions[:]
+        for i in range(self.size):
+            if self.UnitCandidates(i) != self.full:
+                self.Track(i, self.full)
+
+    @property
+    def Topology(self):
+        return self.topology
+
+    @property
+    def Contradiction(self):
+        return self.contradiction
+
+    @property
+    def Dimension(self):
+        return self.dimension
+
+    @property
+    def Counters(self):
+        # (candidates removed, new numbers set, cells flagged changed) by rules so far
+        return (self.eliminated, self.assigned, self.touched)
+
+    @property
+    def Size(self):
+        return self.size
+
+    @property
+    def Solved(self):
+        return self.unsolved == 0
+
+    @property
+    def Changed(self):
+        # True when a cell holds a new number or new candidates
+        return self.pending != 0
+
+    def SetFlags(self, i, flags):
+        # Sets the flags of cell i keeping count of the changed cells and the dirty list
+        before = self.flags[i]
+        if (before ^ flags) & CHANGED:
+            self.pending += 1 if flags & CHANGED else -1
+        if not before & (CHANGED | MARKED) and flags & (CHANGED | MARKED):
+            self.dirty.append(i)
+        self.flags[i] = flags
+
+    def SetSolution(self, i, n):
+        # Sets the number of cell i keeping count of the unsolved cells
+        self.unsolved += (n == 0) - (self.numbers[i] == 0)
+        self.numbers[i] = n
+
+    def SetNumber(self, i, n, isInitial=False):
+        if 0 < n and n <= self.dimension:
+            self.Save(i)
+            before = self.UnitCandidates(i)
+            if isInitial:
+                # Initital number is used, when the sudoku is cleared for retry
+                self.SetFlags(i, self.flags[i] | INITIAL)
+                overwritten = self.numbers[i] != 0
+                self.SetSolution(i, n)
+                self.placed.append(i)
+                if overwritten:
+                    self.UpdateUsed(i)
+                else:
+                    self.Use(i)
+            elif self.numbers[i] != 0:
+                # a solved cell doesn't change, another number is a contradiction,
+                # like when a shared samurai cell gets another number
+                if self.numbers[i] != n:
+                    self.contradiction = True
+            else:
+                if self.Conflicts(i, n):
+                    self.contradiction = True
+                if self.newNumbers[i] != n:
+                    self.assigned += 1
+                if not self.flags[i] & CHANGED:
+                    self.touched += 1
+                self.newNumbers[i] = n
+                # clear candidates, the new number is the only one
+                self.candidates[i] = 0
+                self.newCandidates[i] = 0
+                self.SetFlags(i, self.flags[i] | CHANGED)
+            self.Track(i, before)
+        else:
+            raise ValueError
+
+    def Remove(self, i, candidateToRemove):
+        if 0 < candidateToRemove and candidateToRemove <= self.dimension:
+            if self.numbers[i] == 0:
+                newCandidates = self.newCandidates[i]
+                if not (self.flags[i] & CHANGED) or (newCandidates == 0 and self.newNumbers[i] != 0):
+                    # a changed cell without new number and new candidates has lost all
+                    newCandidates = self.candidates[i]
+                bit = 1 << (candidateToRemove-1)
+                if newCandidates & bit:
+                    self.Save(i)
+                    before = self.UnitCandidates(i)
+                    self.eliminated += 1
+                    if not self.flags[i] & CHANGED:
+                        self.touched += 1
+                    self.SetFlags(i, self.flags[i] | CHANGED)
+                    self.newCandidates[i] = newCandidates & ~bit
+                    self.Track(i, before)
+                    if self.UnitCandidates(i) == 0:
+                        self.contradiction = True
+                elif self.newCandidates[i] != newCandidates:
+                    self.Save(i)
+                    before = self.UnitCandidates(i)
+                    self.newCandidates[i] = newCandidates
+                    self.Track(i, before)
+        else:
+            raise ValueError
+
+    def DoChange(self, i):
+        # Sets the solution, when newNumber holds a solution and clears candidates
+        # Clears newNumber, newCandidates, changed flag and mark
+        flags = self.flags[i] & ~MARKED
+        if self.numbers[i] == 0 and flags & CHANGED:
+            self.Save(i)
+            before = self.UnitCandidates(i)
+            if self.newNumbers[i] != 0:
+                self.SetSolution(i, self.newNumbers[i])
+                self.candidates[i] = 0
+                self.placed.append(i)
+                self.Use(i)
+            newCandidates = self.newCandidates[i]
+            if newCandidates != 0:
+                self.candidates[i] = newCandidates
+                if newCandidates & (newCandidates-1) == 0 and self.numbers[i] == 0:
+                    self.singles.append(i)
+            elif self.numbers[i] == 0:
+                # all candidates removed, the cell is left empty and not with the old ones
+                self.candidates[i] = 0
+                self.contradiction = True
+            self.newCandidates[i] = 0
+            self.newNumbers[i] = 0
+            self.SetFlags(i, flags & ~CHANGED)
+            self.Track(i, before)
+        elif self.flags[i] != flags:
+            self.Save(i)
+            self.SetFlags(i, flags)
+
+    def Mark(self, i):
+        # Marks the cell for the view, like belonging to a pair
+        if not self.flags[i] & MARKED:
+            self.Save(i)
+            self.SetFlags(i, self.flags[i] | MARKED)
+
+    def SetSingleCandidateToNewNumber(self, i):
+        mask = self.candidates[i]
+        if mask != 0 and mask & (mask-1) == 0:
+            # only one candidate left, set cell newNumber and flag changed
+            self.Save(i)
+            before = self.UnitCandidates(i)
+            if self.newNumbers[i] != mask.bit_length():
+                self.assigned += 1
+            if not self.flags[i] & CHANGED:
+                self.touched += 1
+            self.newNumbers[i] = mask.bit_length()
+            self.SetFlags(i, self.flags[i] | CHANGED)
+            self.Track(i, before)
+
+    def TakePlaced(self):
+        # Returns cell ids placed since last call
+        placed = self.placed
+        self.placed = []
+        return placed
+
+    def TakeDirty(self):
+        # Returns cell ids flagged changed or marked since last call, the ones DoChange
+        # of the sudoku has to visit. A cell id may be there twice or no longer dirty.
+        dirty = self.dirty
+        self.dirty = []
+        return dirty
+
+    def TakeSingles(self):
+        # Returns cell ids reduced to a single candidate since last call
+        singles = self.singles
+        self.singles = []
+        return singles
+
+    def CurrentCandidates(self, i):
+        # Candidates seen by rules: newCandidates when changed, because another rule
+        # may have removed candidates. Solved cells have none.
+        result = 0
+        if self.numbers[i] == 0:
+            result = self.candidates[i]
+            if self.flags[i] & CHANGED:
+                result = self.newCandidates[i]
+        return result
+
+    def UnitCandidates(self, i):
+        # Candidates of the cell as seen by its units: like CurrentCandidates, but a new
+        # number counts as the only candidate, so a number isn't placed twice in a unit
+        # before DoChange
+        result = 0
+        if self.numbers[i] == 0:
+            result = self.candidates[i]
+            if self.flags[i] & CHANGED:
+                result = self.newCandidates[i]
+                if self.newNumbers[i] != 0:
+                    result = 1 << (self.newNumbers[i]-1)
+        return result
+
+    def Track(self, i, before):
+        # Updates positions of the candidates of cell i in its units, before holds
+        # the unit candidates of the cell before the change. A number left without place
+        # in a unit, where it isn't used, is a contradiction.
+        if self.topology is not None:
+            changed = before ^ self.UnitCandidates(i)
+            dimension = self.dimension
+            positions = self.positions
+            used = self.used
+            while changed:
+                low = changed & -changed
+                changed ^= low
+                n = low.bit_length() - 1
+                for unit, position in zip(self.cellUnits[i], self.cellPositions[i]):
+                    p = unit*dimension + n
+                    positions[p] ^= 1 << position
+                    if positions[p] == 0 and not used[unit] & low:
+                        self.contradiction = True
+
+    def Use(self, i):
+        # Adds the number of solved cell i to the numbers used in its units, a number
+        # already used in one of them is a contradiction
+        if self.topology is not None:
+            bit = 1 << (self.numbers[i]-1)
+            for unit in self.cellUnits[i]:
+                if self.used[unit] & bit:
+                    self.contradiction = True
+                self.used[unit] |= bit
+
+    def UpdateUsed(self, i):
+        # Recomputes the numbers used in the units of cell i, when a number is overwritten
+        if self.topology is not None:
+            for unit in self.cellUnits[i]:
+                used = 0
+                for j in self.topology.Units[unit]:
+                    if self.numbers[j] != 0:
+                        bit = 1 << (self.numbers[j]-1)
+                        if used & bit:
+                            self.contradiction = True
+                        used |= bit
+                self.used[unit] = used
+
+    def Conflicts(self, i, n):
+        # True when n is the number of a solved cell in a unit of cell i
+        if self.topology is not None:
+            bit = 1 << (n-1)
+            for unit in self.cellUnits[i]:
+                if self.used[unit] & bit:
+                    return True
+        return False
+
+    def Used(self, unit):
+        # Bitmask of the numbers of solved cells in the unit
+        return self.used[unit]
+
+    def Positions(self, unit, n):
+        # Bitmask of positions in the unit, where n is a unit candidate
+        return self.positions[unit*self.dimension + n-1]
+
+    def Attach(self, i, board, j):
+        # Copies cell j of another board to cell i of this board
+        self.Save(i)
+        before = self.UnitCandidates(i)
+        self.SetSolution(i, board.numbers[j])
+        self.newNumbers[i] = board.newNumbers[j]
+        self.candidates[i] = board.candidates[j]
+        self.newCandidates[i] = board.newCandidates[j]
+        self.SetFlags(i, board.flags[j])
+        self.groups[i] = board.groups[j]
+        if self.numbers[i] != 0:
+            self.placed.append(i)
+            self.UpdateUsed(i)
+        self.Track(i, before)
+
+    def Save(self, i):
+        # Records the state of cell i on the trail before it is changed
+        if self.trail is not None:
+            self.trail.append((i, self.numbers[i], self.newNumbers[i], self.candidates[i], self.newCandidates[i], self.flags[i]))
+
+    def TrailMark(self):
+        # Starts recording changes on the trail, when not yet done, and returns a mark
+        # to roll back to with Undo. Marks nest, so a search takes one mark per node.
+        # Undoing costs only the changes made since the mark, unlike Restore of a
+        # Snapshot, which copies the whole board.
+        if self.trail is None:
+            self.trail = []
+        return (len(self.trail), self.placed[:], self.singles[:], self.dirty[:], self.contradiction)
+
+    def Undo(self, mark):
+        # Rolls the cells back to the state at the mark. The marks taken after it are
+        # no longer valid.
+        length, placed, singles, dirty, contradiction = mark
+        trail = self.trail
+        while len(trail) > length:
+            i, number, newNumber, candidates, newCandidates, flags = trail.pop()
+            before = self.UnitCandidates(i)
+            overwritten = self.numbers[i] != number
+            self.SetSolution(i, number)
+            self.newNumbers[i] = newNumber
+            self.candidates[i] = candidates
+            self.newCandidates[i] = newCandidates
+            self.SetFlags(i, flags)
+            self.Track(i, before)
+            if overwritten:
+                self.UpdateUsed(i)
+        self.placed = placed[:]
+        self.singles = singles[:]
+        self.dirty = dirty[:]
+        self.contradiction = contradiction
+
+    def EndTrail(self):
+        # Stops recording changes, all marks are dropped
+        self.trail = None
+
+    def Snapshot(self):
+        # Copy of the cell state, groups never change so they are left out
+        return tuple(getattr(self, name)[:] for name in self._state) + (self.contradiction, self.unsolved, self.pending)
+
+    def Restore(self, snapshot):
+        for name, value in zip(self._state, snapshot):
+            getattr(self, name)[:] = value
+        self.contradiction, self.unsolved, self.pending = snapshot[-3:]
+
+    def Copy(self):
+        # groups and topology are shared, they never change, the trail isn't copied
+        board = copy.copy(self)
+        for name, value in zip(self._state, self.Snapshot()):
+            setattr(board, name, value)
+        board.trail = None
+        return board
@@ -0,0 +1,165 @@
+class DancingLinks:
+    # Algorithm X with dancing links for exact cover problems, see Knuth, "Dancing Links".
+    # The links are held in flat lists indexed by node: node 0 is the root, nodes
+    # 1 to columns are the column headers, and the nodes of the rows follow.
+    def __init__(self, columns):
+        n = columns + 1
+        self.left = [c-1 for c in range(n)]
+        self.left[0] = columns
+        self.right = [c+1 for c in range(n)]
+        self.right[columns] = 0
+        self.up = list(range(n))
+        self.down = list(range(n))
+        self.column = list(range(n)) # column header of each node
+        self.size = [0]*n            # number of nodes in each column
+        self.rowOf = [-1]*n          # row index of each node
+        self.rows = []               # first node of each row
+        self.covered = bytearray(n)  # 1 when a column is covered
+        self.nodes = 0               # number of rows tried by Search
+
+    @property
+    def Nodes(self):
+        return self.nodes
+
+    def AddRow(self, columns):
+        # Adds a row covering the columns, columns are 0 based. Returns the row index.
+        first = 0
+        row = len(self.rows)
+        for c in columns:
+            header = c + 1
+            node = len(self.left)
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            self.column.append(header)
+            self.rowOf.append(row)
+            self.size[header] += 1
+            if first == 0:
+                first = node
+                self.left.append(node)
+                self.right.append(node)
+            else:
+                self.left.append(self.left[first])
+                self.right.append(first)
+                self.right[self.left[first]] = node
+                self.left[first] = node
+        self.rows.append(first)
+        return row
+
+    def Cover(self, header):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        self.covered[header] = 1
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def Uncover(self, header):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+        self.covered[header] = 0
+
+    def Select(self, row):
+        # Puts a row in all solutions, like a given number of a sudoku.
+        # Returns False, when a column of the row is covered by another selected row.
+        node = self.rows[row]
+        result = True
+        j = node
+        while True:
+            if self.covered[self.column[j]]:
+                result = False
+                break
+            j = self.right[j]
+            if j == node:
+                break
+        if result:
+            self.Cover(self.column[node])
+            j = self.right[node]
+            while j != node:
+                self.Cover(self.column[j])
+                j = self.right[j]
+        return result
+
+    def ChooseColumn(self):
+        # The column with fewest rows
+        result = self.right[0]
+        fewest = self.size[result]
+        c = self.right[result]
+        while c != 0 and fewest > 1:
+            if self.size[c] < fewest:
+                result = c
+                fewest = self.size[c]
+            c = self.right[c]
+        return result
+
+    def Search(self, limit=1, maxNodes=None):
+        # Returns up to limit solutions, each is the list of row indexes in the solution
+        # without the selected rows. The search stops, when maxNodes rows are tried.
+        # The links are restored, when the search returns.
+        solutions = []
+        stack = [] # nodes of the rows in the partial solution
+        forward = True
+        while True:
+            if forward:
+                if self.right[0] == 0:
+                    solutions.append([self.rowOf[r] for r in stack])
+                    forward = False
+                else:
+                    c = self.ChooseColumn()
+                    if self.size[c] == 0:
+                        forward = False
+                    else:
+                        self.Cover(c)
+                        self.Push(stack, self.down[c])
+            else:
+                # backtrack, leave the row on top of the stack and try the next row in its column
+                if stack == []:
+                    break
+                r = self.Pop(stack)
+                c = self.column[r]
+                r = self.down[r]
+                if r == c:
+                    self.Uncover(c)
+                    continue
+                self.Push(stack, r)
+                forward = True
+            if len(solutions) >= limit or (maxNodes is not None and self.nodes >= maxNodes):
+                while stack != []:
+                    self.Uncover(self.column[self.Pop(stack)])
+                break
+        return solutions
+
+    def Push(self, stack, node):
+        # Puts the row of the node in the partial solution, its column is covered already
+        self.nodes += 1
+        stack.append(node)
+        j = self.right[node]
+        while j != node:
+            self.Cover(self.column[j])
+            j = self.right[j]
+
+    def Pop(self, stack):
+        node = stack.pop()
+        j = self.left[node]
+        while j != node:
+            self.Uncover(self.column[j])
+            j = self.left[j]
+        return node
@@ -0,0 +1,101 @@
+from basesudoku.dancingLinks import DancingLinks
+
+def ExactCover(topology, numbers):
+    # Builds the exact cover problem of a sudoku from its topology and the number of
+    # each cell id, 0 when not solved. There is a column for each cell, it must have
+    # one number, and a column for each unit and number, the unit must have it once.
+    # Row cell*dimension + number - 1 puts the number in the cell.
+    # Returns the links and the rows of the solved cells, that must be selected.
+    dimension = topology.Dimension
+    size = topology.Size
+    cellUnits = topology.CellUnits
+    units = topology.Units
+    full = (1 << dimension) - 1
+    used = [0]*len(units)
+    for u in range(len(units)):
+        for i in units[u]:
+            if numbers[i]:
+                used[u] |= 1 << (numbers[i] - 1)
+    links = DancingLinks(size + len(units)*dimension)
+    rowIds = []  # row id of each row in the links
+    selected = [] # rows of the solved cells
+    for i in range(size):
+        if numbers[i]:
+            candidates = 1 << (numbers[i] - 1)
+        else:
+            candidates = full
+            for u in cellUnits[i]:
+                candidates &= ~used[u]
+        for n in range(dimension):
+            if candidates & (1 << n):
+                row = links.AddRow([i] + [size + u*dimension + n for u in cellUnits[i]])
+                rowIds.append(i*dimension + n)
+                if numbers[i]:
+                    selected.append(row)
+    return links, rowIds, selected
+
+def CountCovers(topology, numbers, limit=2, maxNodes=None):
+    # Counts the solutions up to limit of the numbers of each cell id, without making a
+    # sudoku, e.g. for the many checks of a generator
+    links, rowIds, selected = ExactCover(topology, numbers)
+    count = 0
+    if all(links.Select(row) for row in selected):
+        count = len(list(links.Search(limit, maxNodes)))
+    return count
+
+class ExactCoverSearch:
+    # Solves a sudoku with dancing links instead of the rules, same surface as Search.
+    # The sudoku must have Topology and Cells in the order of the cell ids.
+    def __init__(self, sudoku, maxNodes=None):
+        self.sudoku = sudoku
+        self.maxNodes = maxNodes # None means no limit
+        self.nodes = 0
+        self.exhausted = False # True when search stopped at maxNodes
+
+    @property
+    def Nodes(self):
+        return self.nodes
+
+    @property
+    def Exhausted(self):
+        return self.exhausted
+
+    def Solutions(self, limit=1):
+        # Returns up to limit solutions, each a list of the number of each cell id
+        sudoku = self.sudoku
+        if sudoku.Changed:
+            sudoku.DoChange()
+        topology = sudoku.Topology
+        dimension = topology.Dimension
+        numbers = [cell.Number for cell in sudoku.Cells]
+        links, rowIds, selected = ExactCover(topology, numbers)
+        result = []
+        if all(links.Select(row) for row in selected):
+            for rows in links.Search(limit, self.maxNodes):
+                solution = list(numbers)
+                for row in rows:
+                    solution[rowIds[row] // dimension] = rowIds[row] % dimension + 1
+                result.append(solution)
+        self.nodes = links.Nodes
+        self.exhausted = self.maxNodes is not None and self.nodes >= self.maxNodes and len(result) < limit
+        return result
+
+    def Count(self, limit=2):
+        # Counts the solutions up to limit. The sudoku is left as it was, the changes
+        # committed by Solutions are undone like in Search.Count.
+        sudoku = self.sudoku
+        start = sudoku.TrailMark()
+        count = len(self.Solutions(limit))
+        sudoku.Undo(start)
+        sudoku.EndTrail()
+        return count
+
+    def Run(self):
+        # Returns True when the sudoku is solved
+        solutions = self.Solutions()
+        if solutions != []:
+            for cell, number in zip(self.sudoku.Cells, solutions[0]):
+                if not cell.Solved:
+                    cell.Number = number
+            self.sudoku.DoChange()
+        return solutions != []
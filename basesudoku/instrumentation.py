@@ -0,0 +1,107 @@
+import json
+import time
+
+# Instrumentation of the rules. A sudoku with instrumentation records each rule
+# invocation as a RuleRecord and passes it to its sinks, see BaseSudoku.Instrument.
+
+class RuleRecord:
+    # One invocation of a rule: wall time and the changes it made. A placed number is a
+    # new number set in a cell, it is committed by DoChange.
+    def __init__(self, rule, seconds, eliminated, placed, touched):
+        self.rule = rule
+        self.seconds = seconds
+        self.eliminated = eliminated
+        self.placed = placed
+        self.touched = touched
+
+    @property
+    def Rule(self):
+        return self.rule
+
+    @property
+    def Seconds(self):
+        return self.seconds
+
+    @property
+    def Eliminated(self):
+        return self.eliminated
+
+    @property
+    def Placed(self):
+        return self.placed
+
+    @property
+    def Touched(self):
+        return self.touched
+
+    @property
+    def Changed(self):
+        return self.touched > 0
+
+    def AsDict(self):
+        return { 'rule': self.rule, 'seconds': self.seconds, 'eliminated': self.eliminated
+               , 'placed': self.placed, 'touched': self.touched }
+
+class CounterSink:
+    # Totals for each rule in memory: calls, calls that changed the sudoku, seconds,
+    # eliminated, placed and touched
+    def __init__(self):
+        self.totals = {}
+
+    def Record(self, record):
+        totals = self.totals.get(record.rule)
+        if totals is None:
+            totals = { 'calls': 0, 'changed': 0, 'seconds': 0.0, 'eliminated': 0, 'placed': 0, 'touched': 0 }
+            self.totals[record.rule] = totals
+        totals['calls'] += 1
+        totals['changed'] += 1 if record.Changed else 0
+        totals['seconds'] += record.seconds
+        totals['eliminated'] += record.eliminated
+        totals['placed'] += record.placed
+        totals['touched'] += record.touched
+
+    @property
+    def Totals(self):
+        return self.totals
+
+    def Yield(self, rule):
+        # Eliminated candidates and placed numbers per microsecond of the rule
+        totals = self.totals.get(rule)
+        result = 0.0
+        if totals is not None and totals['seconds'] > 0:
+            result = (totals['eliminated'] + totals['placed']) / (totals['seconds']*1e6)
+        return result
+
+class JsonLinesSink:
+    # Writes each record as a line of JSON to an open text file
+    def __init__(self, out):
+        self.out = out
+
+    def Record(self, record):
+        self.out.write(json.dumps(record.AsDict()) + '\n')
+
+class CallbackSink:
+    # Calls back with each record
+    def __init__(self, callback):
+        self.callback = callback
+
+    def Record(self, record):
+        self.callback(record)
+
+def RuleName(rule):
+    return getattr(rule, '__name__', None) or getattr(getattr(rule, 'func', None), '__name__', repr(rule))
+
+def RunRule(sudoku, rule):
+    # Runs the rule and records it in the sinks of the sudoku, when it has any
+    sinks = sudoku.Sinks
+    if sinks:
+        before = sudoku.Counters
+        start = time.perf_counter()
+        rule()
+        seconds = time.perf_counter() - start
+        after = sudoku.Counters
+        record = RuleRecord(RuleName(rule), seconds, after[0] - before[0], after[1] - before[1], after[2] - before[2])
+        for sink in sinks:
+            sink.Record(record)
+    else:
+        rule()
@@ -0,0 +1,52 @@
+import math
+
+# One line formats of sudokus. A grid is written row by row with a symbol for each cell:
+# the numbers 1 to 25 are '123456789ABCDEFGHIJKLMNOP' and '.' or '0' is an empty cell,
+# like the common 81 character format for 9x9 sudokus.
+SYMBOLS = '123456789ABCDEFGHIJKLMNOP'
+# Group indexes 0 to 24 of jigsaw shapes
+GROUP_SYMBOLS = 'ABCDEFGHIJKLMNOPQRSTUVWXY'
+
+def MakeTable(symbols, first):
+    # Number of each symbol, lower case letters too
+    table = {}
+    for i in range(len(symbols)):
+        table[symbols[i]] = i + first
+        table[symbols[i].lower()] = i + first
+    return table
+
+NUMBERS = MakeTable(SYMBOLS, 1)
+NUMBERS['.'] = 0
+NUMBERS['0'] = 0
+GROUPS = MakeTable(GROUP_SYMBOLS, 0)
+
+def GridDimension(text):
+    # Dimension of the grid written in the text
+    dimension = math.isqrt(len(text))
+    if dimension*dimension != len(text) or dimension < 1 or dimension > len(SYMBOLS):
+        raise ValueError("Bad sudoku grid length: " + str(len(text)))
+    return dimension
+
+def BoxDimension(dimension):
+    # Width of the square groups of a normal or samurai grid, jigsaw groups need no square
+    rho = math.isqrt(dimension)
+    if rho*rho != dimension:
+        raise ValueError("Sudoku dimension has no square groups: " + str(dimension))
+    return rho
+
+def ParseGrid(text, dimension, table=NUMBERS):
+    # The list of numbers of the cells in the text of a grid, 0 is an empty cell
+    try:
+        result = [table[symbol] for symbol in text]
+    except KeyError as error:
+        raise ValueError("Bad sudoku symbol: " + error.args[0]) from None
+    if max(result, default=0) > dimension:
+        raise ValueError("Sudoku symbol out of range: " + text[result.index(max(result))])
+    return result
+
+def FormatGrid(numbers):
+    # The text of the numbers of the cells in a grid, see ParseGrid
+    return ''.join([SYMBOLS[n-1] if n else '.' for n in numbers])
+
+def FormatShape(shape):
+    return ''.join([GROUP_SYMBOLS[group] for row in shape for group in row])
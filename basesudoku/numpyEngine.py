@@ -0,0 +1,187 @@
+# Candidate elimination with NumPy for a batch of sudokus of one topology. Numbers and
+# candidate bitmasks are arrays with the boards along the first axis and the cell ids
+# along the second, so thousands of boards propagate in one pass of array operations.
+# NumPy is optional, the engine is only registered in search.ENGINES when it is found.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from basesudoku.exactCover import ExactCoverSearch
+
+# Index arrays of topologies, see UnitArrays
+_arrays = {}
+
+def Available():
+    return np is not None
+
+def UnitArrays(topology):
+    # (units, cellUnits): cell ids of each unit and units of each cell. Cells of a samurai
+    # sudoku have more units, when shared, so cellUnits is padded with the extra unit
+    # len(units), which never holds a number.
+    arrays = _arrays.get(topology)
+    if arrays is None:
+        units = np.array(topology.Units, dtype=np.intp)
+        width = max(len(cellUnits) for cellUnits in topology.CellUnits)
+        cellUnits = np.full((topology.Size, width), len(topology.Units), dtype=np.intp)
+        for i, ids in enumerate(topology.CellUnits):
+            cellUnits[i, :len(ids)] = ids
+        arrays = (units, cellUnits)
+        _arrays[topology] = arrays
+    return arrays
+
+class NumpyBoards:
+    # Numbers and candidates of a batch of boards of one topology
+    def __init__(self, topology, numbers):
+        if np is None:
+            raise ImportError("NumPy is needed for the numpy engine")
+        self.topology = topology
+        self.dimension = topology.Dimension
+        self.full = (1 << self.dimension) - 1
+        self.units, self.cellUnits = UnitArrays(topology)
+        self.numbers = np.array(numbers, dtype=np.uint8).reshape(-1, topology.Size)
+        self.candidates = np.where(self.numbers == 0, np.uint32(self.full), np.uint32(0))
+        self.contradiction = np.zeros(len(self.numbers), dtype=bool)
+
+    @property
+    def Numbers(self):
+        return self.numbers
+
+    @property
+    def Candidates(self):
+        return self.candidates
+
+    @property
+    def Contradiction(self):
+        # True for each board, that has no solution
+        return self.contradiction
+
+    @property
+    def Solved(self):
+        return (self.numbers != 0).all(axis=1) & ~self.contradiction
+
+    def Bits(self, numbers):
+        # Candidate bit of each number, 0 for empty cells
+        shift = np.maximum(numbers, 1).astype(np.uint32) - 1
+        return np.where(numbers > 0, np.left_shift(np.uint32(1), shift), np.uint32(0))
+
+    def Count(self, masks):
+        # Number of bits set in each uint32 mask, a popcount on the mask array itself, so
+        # no array with an axis for the bits is made
+        masks = masks - ((masks >> 1) & np.uint32(0x55555555))
+        masks = (masks & np.uint32(0x33333333)) + ((masks >> 2) & np.uint32(0x33333333))
+        masks = (masks + (masks >> 4)) & np.uint32(0x0F0F0F0F)
+        return (masks * np.uint32(0x01010101)) >> 24
+
+    def Used(self):
+        # (boards, units + 1) bitmask of the numbers in each unit, the padding unit is 0
+        used = np.bitwise_or.reduce(self.Bits(self.numbers)[:, self.units], axis=2)
+        return np.concatenate([used, np.zeros((len(used), 1), dtype=used.dtype)], axis=1)
+
+    def Eliminate(self):
+        # Removes the numbers in the units of each cell from its candidates and finds
+        # the boards, that break the rules
+        used = self.Used()
+        forbidden = np.bitwise_or.reduce(used[:, self.cellUnits], axis=2)
+        self.candidates &= ~forbidden
+        self.candidates[self.numbers != 0] = 0
+        used = used[:, :-1]
+        unitNumbers = self.numbers[:, self.units]
+        # a number twice in a unit
+        bad = ((unitNumbers != 0).sum(axis=2) != self.Count(used)).any(axis=1)
+        # a cell without candidates
+        bad |= ((self.numbers == 0) & (self.candidates == 0)).any(axis=1)
+        # a number without a place in a unit
+        places = np.bitwise_or.reduce(self.candidates[:, self.units], axis=2) | used
+        bad |= (places != self.full).any(axis=1)
+        self.contradiction |= bad
+
+    def Singles(self):
+        # Returns (boards, cells, numbers) of naked singles, cells with one candidate,
+        # and hidden singles, numbers with one place in a unit
+        candidates = self.candidates
+        naked = (candidates != 0) & (candidates & (candidates - 1) == 0)
+        b, cells = np.nonzero(naked)
+        numbers = np.log2(candidates[b, cells]).astype(np.uint8) + 1
+        unitCandidates = candidates[:, self.units]
+        boards, ids, found = [b], [cells], [numbers]
+        # one number at a time, so the arrays stay (boards, units, cells of a unit)
+        for n in range(self.dimension):
+            places = (unitCandidates >> np.uint32(n)) & 1
+            hb, hu = np.nonzero(places.sum(axis=2) == 1)
+            boards.append(hb)
+            ids.append(self.units[hu, places[hb, hu].argmax(axis=1)])
+            found.append(np.full(len(hb), n + 1, dtype=np.uint8))
+        return np.concatenate(boards), np.concatenate(ids), np.concatenate(found)
+
+    def Propagate(self, maxPasses=None):
+        # Eliminates and places singles until no board changes. Boards with a
+        # contradiction are left as they are. Returns the number of passes.
+        passes = 0
+        while maxPasses is None or passes < maxPasses:
+            passes += 1
+            self.Eliminate()
+            b, cells, numbers = self.Singles()
+            keep = ~self.contradiction[b]
+            b, cells, numbers = b[keep], cells[keep], numbers[keep]
+            if len(b) == 0:
+                break
+            # two numbers for one cell is a contradiction
+            placed = np.zeros(self.numbers.shape, dtype=np.uint32)
+            np.bitwise_or.at(placed, (b, cells), self.Bits(numbers))
+            twice = (placed & (placed - 1)) != 0
+            self.contradiction |= twice.any(axis=1)
+            self.numbers[b, cells] = numbers
+            self.candidates[b, cells] = 0
+        return passes
+
+def Boards(sudokus):
+    # NumpyBoards of the sudokus, they must have the same topology
+    topology = sudokus[0].Topology
+    for sudoku in sudokus:
+        if sudoku.Changed:
+            sudoku.DoChange()
+    return NumpyBoards(topology, [[cell.Number for cell in sudoku.Cells] for sudoku in sudokus])
+
+def WriteBack(boards, b, sudoku):
+    # Sets the numbers of board b found by propagation in the sudoku
+    numbers = boards.Numbers[b]
+    for cell, number in zip(sudoku.Cells, numbers.tolist()):
+        if number and not cell.Solved:
+            cell.Number = number
+    sudoku.DoChange()
+
+class NumpySearch:
+    # Propagates with NumPy, then solves the rest with dancing links, same surface as Search
+    def __init__(self, sudoku, maxNodes=None):
+        self.sudoku = sudoku
+        self.search = ExactCoverSearch(sudoku, maxNodes)
+
+    @property
+    def Nodes(self):
+        return self.search.Nodes
+
+    @property
+    def Exhausted(self):
+        return self.search.Exhausted
+
+    def Count(self, limit=2):
+        # Counts the solutions up to limit, the sudoku is left as it was
+        snapshot = self.sudoku.Snapshot()
+        boards = Boards([self.sudoku])
+        boards.Propagate()
+        result = 0
+        if not boards.Contradiction[0]:
+            WriteBack(boards, 0, self.sudoku)
+            result = self.search.Count(limit)
+        self.sudoku.Restore(snapshot)
+        return result
+
+    def Run(self):
+        boards = Boards([self.sudoku])
+        boards.Propagate()
+        result = False
+        if not boards.Contradiction[0]:
+            WriteBack(boards, 0, self.sudoku)
+            result = self.search.Run()
+        return result
@@ -0,0 +1,153 @@
+import time
+
+# Told by TakeStep when the board has found a contradiction, see Board.Contradiction
+CONTRADICTION = 'a cell has no candidate or a number has no place'
+
+class Rule:
+    # A rule for solving: the name shown by TakeStep, the method applying the rule and
+    # an estimate of the cost of one pass, cheap rules have low cost
+    def __init__(self, name, method, cost):
+        self.name = name
+        self.method = method
+        self.cost = cost
+        # measured by an adaptive pipeline
+        self.calls = 0
+        self.seconds = 0.0
+        self.found = 0 # candidates removed and numbers set
+
+    @property
+    def Name(self):
+        return self.name
+
+    @property
+    def Method(self):
+        return self.method
+
+    @property
+    def Cost(self):
+        return self.cost
+
+    @property
+    def Yield(self):
+        # Candidates removed and numbers set per microsecond, None until measured
+        result = None
+        if self.calls > 0:
+            result = self.found / max(self.seconds*1e6, 1e-3)
+        return result
+
+class RulePipeline:
+    # Schedules the rules of a sudoku, shared by all sudoku types. The rules are tried
+    # cheapest first and after each change the cheapest rule is tried again, so an
+    # expensive rule only runs, when all cheaper rules are stalled. An adaptive pipeline
+    # measures the rules and orders them by yield per microsecond instead, rules not
+    # measured yet come first in order of cost.
+    def __init__(self, sudoku, rules, adaptive=False):
+        self.sudoku = sudoku
+        self.rules = sorted(rules, key=lambda rule: rule.cost)
+        self.adaptive = adaptive
+        self.position = 0     # the rule tried next by Step
+        self.update = False   # True when Step commits changes next
+        self.checked = False  # True when the constraints are checked by Step
+
+    @property
+    def Rules(self):
+        return self.rules
+
+    @property
+    def Position(self):
+        return self.position
+
+    @property
+    def Adaptive(self):
+        return self.adaptive
+
+    @Adaptive.setter
+    def Adaptive(self, adaptive):
+        self.adaptive = adaptive
+        self.Reorder()
+
+    def Reorder(self):
+        if self.adaptive:
+            self.rules.sort(key=lambda rule: (0, rule.cost) if rule.Yield is None else (1, -rule.Yield))
+        else:
+            self.rules.sort(key=lambda rule: rule.cost)
+
+    def RunRule(self, rule):
+        sudoku = self.sudoku
+        if self.adaptive:
+            before = sudoku.Counters
+            start = time.perf_counter()
+            sudoku.RunRule(rule.method)
+            rule.seconds += time.perf_counter() - start
+            after = sudoku.Counters
+            rule.calls += 1
+            rule.found += (after[0] - before[0]) + (after[1] - before[1])
+        else:
+            sudoku.RunRule(rule.method)
+
+    def Step(self):
+        # Takes one step: tries the next rule or commits the changes of the last rule.
+        # Returns a text telling what was done.
+        sudoku = self.sudoku
+        if not self.checked:
+            self.checked = sudoku.Check()
+        if not self.checked:
+            result = 'Sudoku is bad. It has two or more cells with same number'
+        elif sudoku.Contradiction:
+            result = 'Sudoku is bad. ' + CONTRADICTION
+        elif sudoku.Solved:
+            result = 'Done, solved'
+        elif self.update:
+            sudoku.DoChange()
+            self.update = False
+            self.position = 0
+            self.Reorder()
+            result = 'Update sudoku'
+            # the board flags a number twice in a unit as it is set, see Board.Contradiction,
+            # the constraints are only checked to tell which contradiction was found
+            if sudoku.Contradiction:
+                self.checked = sudoku.Check()
+                if not self.checked:
+                    result = result + ' Sudoku is bad, two or more cells have same number'
+                else:
+                    result = result + ' Sudoku is bad, ' + CONTRADICTION
+        else:
+            rule = self.rules[self.position]
+            self.RunRule(rule)
+            if sudoku.Contradiction:
+                # no update, the changes of the rule are left to be seen
+                result = rule.name + ", yes. Sudoku is bad, " + CONTRADICTION
+            elif sudoku.Changed:
+                result = rule.name + ", yes"
+                self.update = True
+            else:
+                result = rule.name + ", no"
+                self.position += 1
+                if self.position == len(self.rules):
+                    # stalled, the rules can't solve the sudoku, start over
+                    result = result + ", no rule finds more"
+                    self.position = 0
+        return result
+
+    def Run(self):
+        # Applies the rules until none of them changes the sudoku. Returns False when the
+        # sudoku is bad: a cell is left without candidates or two cells in a row, column
+        # or group have the same number. Both are caught by the board as they happen,
+        # see Board.Contradiction, so no Check is needed.
+        sudoku = self.sudoku
+        self.update = False
+        self.position = 0
+        r = 0
+        while r < len(self.rules) and not sudoku.Solved:
+            self.RunRule(self.rules[r])
+            if sudoku.Contradiction:
+                return False
+            if sudoku.Changed:
+                sudoku.DoChange()
+                if sudoku.Contradiction:
+                    return False
+                self.Reorder()
+                r = 0
+            else:
+                r += 1
+        return not sudoku.Contradiction
@@ -0,0 +1,138 @@
+import importlib.util
+
+from basesudoku.basecell import CountCandidates
+from basesudoku.exactCover import ExactCoverSearch
+
+def ApplyRules(sudoku):
+    # Applies the rules of the sudoku until none of them changes the sudoku, see
+    # RulePipeline.Run. Returns False when the sudoku is bad.
+    return sudoku.Pipeline.Run()
+
+def ChooseCell(sudoku):
+    # Minimum remaining values: the unsolved cell with fewest candidates
+    result = None
+    fewest = sudoku.Dimension + 1
+    for cell in sudoku.Cells:
+        if not cell.Solved:
+            count = CountCandidates(cell.CandidateMask)
+            if count < fewest:
+                result = cell
+                fewest = count
+                if count <= 1:
+                    break
+    return result
+
+class Search:
+    # Depth first search for the solution of a sudoku. The rules are applied to a
+    # fixpoint first and on every node of the search. The cell with fewest candidates
+    # is branched on, and the sudoku is rolled back on the trail on backtrack.
+    def __init__(self, sudoku, maxNodes=None):
+        self.sudoku = sudoku
+        self.maxNodes = maxNodes # None means no limit
+        self.nodes = 0
+        self.exhausted = False # True when search stopped at maxNodes
+
+    @property
+    def Nodes(self):
+        return self.nodes
+
+    @property
+    def Exhausted(self):
+        return self.exhausted
+
+    def Run(self):
+        # Returns True when the sudoku is solved
+        sudoku = self.sudoku
+        if not ApplyRules(sudoku):
+            return False
+        root = sudoku.TrailMark()
+        stack = [] # (mark, cell, candidates left to try)
+        while not sudoku.Solved:
+            cell = ChooseCell(sudoku)
+            stack.append((sudoku.TrailMark(), cell, cell.Candidates))
+            descended = False
+            while stack and not descended:
+                mark, cell, candidates = stack[-1]
+                if candidates == []:
+                    stack.pop()
+                elif self.maxNodes is not None and self.nodes >= self.maxNodes:
+                    self.exhausted = True
+                    stack = []
+                else:
+                    sudoku.Undo(mark)
+                    self.nodes += 1
+                    cell.Number = candidates.pop(0)
+                    sudoku.DoChange()
+                    descended = ApplyRules(sudoku)
+            if not descended:
+                # no solution, or maxNodes reached, leave the sudoku as after the rules
+                sudoku.Undo(root)
+                sudoku.EndTrail()
+                return False
+        sudoku.EndTrail()
+        return True
+
+    def Count(self, limit=2):
+        # Counts the solutions up to limit, like Run but going on after a solution.
+        # The sudoku is left as it was.
+        sudoku = self.sudoku
+        start = sudoku.TrailMark()
+        count = 0
+        stack = [] # (mark, cell, candidates left to try)
+        if ApplyRules(sudoku):
+            if sudoku.Solved:
+                count = 1
+            else:
+                cell = ChooseCell(sudoku)
+                stack.append((sudoku.TrailMark(), cell, cell.Candidates))
+        while stack and count < limit:
+            mark, cell, candidates = stack[-1]
+            if candidates == []:
+                stack.pop()
+            elif self.maxNodes is not None and self.nodes >= self.maxNodes:
+                self.exhausted = True
+                stack = []
+            else:
+                sudoku.Undo(mark)
+                self.nodes += 1
+                cell.Number = candidates.pop(0)
+                sudoku.DoChange()
+                if ApplyRules(sudoku):
+                    if sudoku.Solved:
+                        count += 1
+                    else:
+                        cell = ChooseCell(sudoku)
+                        stack.append((sudoku.TrailMark(), cell, cell.Candidates))
+        sudoku.Undo(start)
+        sudoku.EndTrail()
+        return count
+
+# Solver engines by name, see Solve
+ENGINES = {'rules': Search, 'dlx': ExactCoverSearch}
+def NumpySearch(sudoku, maxNodes=None):
+    # numpyEngine.NumpySearch, NumPy is imported on first use, it takes long to import
+    from basesudoku import numpyEngine
+    return numpyEngine.NumpySearch(sudoku, maxNodes)
+
+if importlib.util.find_spec('numpy') is not None:
+    ENGINES['numpy'] = NumpySearch
+
+def Solve(sudoku, maxNodes=None, engine='rules'):
+    # Solves the sudoku with the engine: 'rules' applies the rules and searches depth
+    # first, 'dlx' solves the exact cover problem with dancing links and 'numpy'
+    # propagates with NumPy before dancing links, when NumPy is installed.
+    if not engine in ENGINES:
+        raise ValueError("Unknown solver engine: " + str(engine))
+    return ENGINES[engine](sudoku, maxNodes).Run()
+
+def CountSolutions(sudoku, limit=2, maxNodes=None, engine='rules'):
+    # Counts the solutions of the sudoku, stops when limit solutions are found, so the
+    # default tells whether it has none, one or more. Returns (count, nodes), count is
+    # None when the search stopped at maxNodes nodes before.
+    if not engine in ENGINES:
+        raise ValueError("Unknown solver engine: " + str(engine))
+    search = ENGINES[engine](sudoku, maxNodes)
+    count = search.Count(limit)
+    if search.Exhausted:
+        count = None
+    return count, search.Nodes
@@ -0,0 +1,19 @@
+from basesudoku.basecell import CountCandidates
+
+def Subsets(masks, size):
+    # Yields (indexes, union) of each combination of size masks, whose union has exactly
+    # size bits. Used for naked subsets, where the masks are candidates of cells, and
+    # hidden subsets, where the masks are positions of candidates in a unit.
+    # A combination is dropped as soon as its union has more than size bits.
+    chosen = []
+    def Extend(start, union):
+        for j in range(start, len(masks)):
+            extended = union | masks[j]
+            if CountCandidates(extended) <= size:
+                chosen.append(j)
+                if len(chosen) == size:
+                    yield tuple(chosen), extended
+                else:
+                    yield from Extend(j + 1, extended)
+                chosen.pop()
+    yield from Extend(0, 0)
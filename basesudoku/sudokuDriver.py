@@ -0,0 +1,90 @@
+from basesudoku.search import Solve, CountSolutions
+from basesudoku.instrumentation import RunRule
+from basesudoku.rulePipeline import Rule, RulePipeline
+
+class SudokuDriver:
+    # Solving surface shared by all sudoku types: the rules and their pipeline, the
+    # instrumentation, the search and the trail. A sudoku using it sets self.sinks = []
+    # and self.pipeline = None, holds its state in the boards of Boards and has the rule
+    # methods named in Rules. Only the naked pairs differ by type, see NakedPairRules.
+
+    @property
+    def Sinks(self):
+        return self.sinks
+
+    @property
+    def Counters(self):
+        # (candidates removed, new numbers set, cells flagged changed) by rules so far,
+        # summed over the boards, a shared samurai cell counts in both grids
+        result = (0, 0, 0)
+        for board in self.Boards:
+            result = tuple(total + count for total, count in zip(result, board.Counters))
+        return result
+
+    def Instrument(self, *sinks):
+        # Records each rule invocation from TakeStep and Solve in the sinks, see
+        # instrumentation. Without sinks the instrumentation is off.
+        self.sinks = list(sinks)
+
+    def RunRule(self, rule):
+        RunRule(self, rule)
+
+    def Snapshot(self):
+        return [board.Snapshot() for board in self.Boards]
+
+    def Restore(self, snapshot):
+        for board, boardSnapshot in zip(self.Boards, snapshot):
+            board.Restore(boardSnapshot)
+
+    def TrailMark(self):
+        # Mark to roll the sudoku back to with Undo, see Board.TrailMark
+        return [board.TrailMark() for board in self.Boards]
+
+    def Undo(self, mark):
+        for board, boardMark in zip(self.Boards, mark):
+            board.Undo(boardMark)
+
+    def EndTrail(self):
+        for board in self.Boards:
+            board.EndTrail()
+
+    def Rules(self):
+        # The rules for solving with their cost, see RulePipeline
+        return ( [ Rule('Set single candidate as solution in cells', self.SetSingleCandidatesAsnewNumber, 1)
+                 , Rule('Find possible candidates', self.FindPossibleCandidates, 2)
+                 , Rule('Find single candidate in row, column and group', self.SetSingles, 3)
+                 , Rule('Find locked candidates', self.FindLockedCandidates, 5) ]
+               + self.NakedPairRules()
+               + [ Rule('Find hidden pairs', self.FindHiddenPairs, 15)
+                 , Rule('Find x-wings', self.FindXWings, 18)
+                 , Rule('Find naked triples', self.FindNakedTriples, 20)
+                 , Rule('Find hidden triples', self.FindHiddenTriples, 25)
+                 , Rule('Find swordfish', self.FindSwordfish, 28)
+                 , Rule('Find naked quads', self.FindNakedQuads, 30)
+                 , Rule('Find jellyfish', self.FindJellyfish, 35) ] )
+
+    @property
+    def Pipeline(self):
+        if self.pipeline is None:
+            self.pipeline = RulePipeline(self, self.Rules())
+        return self.pipeline
+
+    def TakeStep(self):
+        # Takes one step of solving with the rules, returns a text telling what was done
+        return self.Pipeline.Step()
+
+    def GetState(self):
+        # The position of the rule tried next in the pipeline
+        return self.Pipeline.Position
+
+    def Solve(self, maxNodes=None, engine='rules'):
+        # Applies the rules until they don't change the sudoku, then searches depth first
+        # for a solution, or with engine 'dlx' solves it with dancing links. Returns True
+        # when solved, False when the sudoku has no solution or maxNodes search nodes are
+        # tried without finding one.
+        return Solve(self, maxNodes, engine)
+
+    def CountSolutions(self, limit=2, maxNodes=None, engine='rules'):
+        # Counts the solutions up to limit, 2 tells whether the solution is unique.
+        # Returns (count, search nodes), see search.CountSolutions. The sudoku isn't changed.
+        return CountSolutions(self, limit, maxNodes, engine)
@@ -0,0 +1,233 @@
+from array import array
+import math
+
+class Topology:
+    # Units and peers of the cells of a sudoku shape. A unit is a tuple of cell ids, that
+    # must hold different numbers, like a row, a column or a group. Peers of a cell are
+    # the other cells in the units of the cell. A topology never changes, so all sudokus
+    # of the same shape share one, see GetTopology.
+    def __init__(self, dimension, size, units):
+        self.dimension = dimension
+        self.size = size # number of cells
+        self.units = tuple(tuple(unit) for unit in units)
+        cellUnits = []
+        for i in range(size):
+            cellUnits.append([])
+        for u in range(len(self.units)):
+            for i in self.units[u]:
+                cellUnits[i].append(u)
+        self.cellUnits = tuple(tuple(units) for units in cellUnits) # units of each cell
+        # position of each cell in its units, same order as cellUnits
+        self.cellPositions = tuple(tuple(self.units[u].index(i) for u in self.cellUnits[i]) for i in range(size))
+        peers = []
+        for i in range(size):
+            cellPeers = set()
+            for u in self.cellUnits[i]:
+                cellPeers.update(self.units[u])
+            cellPeers.discard(i)
+            peers.append(tuple(sorted(cellPeers)))
+        self.peers = tuple(peers)
+        # positions of each number in each unit of an empty sudoku, all cells of the unit,
+        # see Board.SetTopology
+        self.fullPositions = array('L', [((1 << len(unit)) - 1) for unit in self.units for n in range(dimension)])
+
+    @property
+    def Dimension(self):
+        return self.dimension
+
+    @property
+    def Size(self):
+        return self.size
+
+    @property
+    def Units(self):
+        return self.units
+
+    @property
+    def Peers(self):
+        return self.peers
+
+    @property
+    def CellUnits(self):
+        return self.cellUnits
+
+    @property
+    def CellPositions(self):
+        return self.cellPositions
+
+    @property
+    def FullPositions(self):
+        return self.fullPositions
+
+class GridTopology(Topology):
+    # Topology of one sudoku grid, cell id is row*dimension + column.
+    # Units are ordered rows, columns and then groups.
+    def __init__(self, dimension, groupOfCell):
+        size = dimension*dimension
+        self.groupOfCell = tuple(groupOfCell) # group index of each cell id
+        self.rows = tuple(tuple(range(r*dimension, (r+1)*dimension)) for r in range(dimension))
+        self.columns = tuple(tuple(range(c, size, dimension)) for c in range(dimension))
+        groups = []
+        for g in range(dimension):
+            groups.append([])
+        for i in range(size):
+            groups[self.groupOfCell[i]].append(i)
+        self.groups = tuple(tuple(group) for group in groups)
+        super().__init__(dimension, size, self.rows + self.columns + self.groups)
+        # Intersections of each group with rows and columns as (group unit, line unit,
+        # positions in the group, positions in the line), see BaseSudoku.FindLockedCandidates
+        intersections = []
+        for group in self.GroupUnits:
+            for line in list(self.RowUnits) + list(self.ColumnUnits):
+                groupPositions = 0
+                linePositions = 0
+                for i in set(self.units[group]) & set(self.units[line]):
+                    groupPositions |= 1 << self.units[group].index(i)
+                    linePositions |= 1 << self.units[line].index(i)
+                if groupPositions != 0:
+                    intersections.append((group, line, groupPositions, linePositions))
+        self.intersections = tuple(intersections)
+
+    @property
+    def RowUnits(self):
+        return range(0, self.dimension)
+
+    @property
+    def ColumnUnits(self):
+        return range(self.dimension, 2*self.dimension)
+
+    @property
+    def GroupUnits(self):
+        return range(2*self.dimension, 3*self.dimension)
+
+    @property
+    def Intersections(self):
+        return self.intersections
+
+    @property
+    def Rows(self):
+        return self.rows
+
+    @property
+    def Columns(self):
+        return self.columns
+
+    @property
+    def Groups(self):
+        return self.groups
+
+    def Group(self, row, column):
+        return self.groupOfCell[row*self.dimension + column]
+
+def SquareGroups(dimension):
+    # group index of each cell id for normal sudokus, the upper left square is
+    # indexed 0, next to the right 1, and so forth.
+    rho = round(math.sqrt(dimension))
+    groupOfCell = []
+    for r in range(dimension):
+        for c in range(dimension):
+            groupOfCell.append((r//rho)*rho + (c//rho))
+    return tuple(groupOfCell)
+
+# Registry of topologies by (dimension, group index of each cell id)
+_topologies = {}
+
+def GetTopologyForGroups(dimension, groupOfCell):
+    key = (dimension, tuple(groupOfCell))
+    topology = _topologies.get(key)
+    if topology is None:
+        topology = GridTopology(dimension, key[1])
+        _topologies[key] = topology
+    return topology
+
+def GetTopology(dimension, shape=None):
+    # Topology of a normal sudoku, when shape is None, otherwise of the jigsaw shape,
+    # where shape is rows of group indexes.
+    if shape is None:
+        topology = _topologies.get((dimension, None))
+        if topology is None:
+            topology = GetTopologyForGroups(dimension, SquareGroups(dimension))
+            _topologies[(dimension, None)] = topology
+    else:
+        topology = GetTopologyForGroups(dimension, [group for row in shape for group in row])
+    return topology
+
+class SamuraiTopology(Topology):
+    # Topology of a samurai sudoku of five normal grids. The corner groups of the grid 2
+    # in the middle are shared with a corner group of each of the grids 0, 1, 3 and 4.
+    # A shared cell has one cell id, cellIds maps grid index and grid cell id to it.
+    def __init__(self, dimension, grid):
+        self.dimension = dimension
+        self.grid = grid
+        self.gridTopology = GetTopology(dimension)
+        rho = round(math.sqrt(dimension))
+        self.rho = rho
+        gridSize = dimension*dimension
+        cellIds = []
+        size = 0
+        for s in range(grid):
+            ids = []
+            for r in range(dimension):
+                for c in range(dimension):
+                    twin = self.Twin(s, r, c)
+                    if twin is not None and twin[0] < s:
+                        ids.append(cellIds[twin[0]][twin[1]*dimension + twin[2]])
+                    else:
+                        ids.append(size)
+                        size += 1
+            cellIds.append(tuple(ids))
+        self.cellIds = tuple(cellIds)
+        # units of all grids, the shared groups only once
+        units = []
+        seen = set()
+        for s in range(grid):
+            for unit in self.gridTopology.Units:
+                ids = tuple(self.cellIds[s][i] for i in unit)
+                if not frozenset(ids) in seen:
+                    seen.add(frozenset(ids))
+                    units.append(ids)
+        super().__init__(dimension, size, units)
+
+    def Twin(self, s, row, col):
+        # The (grid, row, column) of the shared cell in the other grid, None when not shared
+        rho = self.rho
+        corner = self.dimension - rho
+        result = None
+        if s == 2:
+            if row < rho and col < rho:
+                result = (0, corner + row, corner + col)
+            elif row < rho and col >= corner:
+                result = (1, corner + row, col - corner)
+            elif row >= corner and col < rho:
+                result = (3, row - corner, corner + col)
+            elif row >= corner and col >= corner:
+                result = (4, row - corner, col - corner)
+        elif s == 0 and row >= corner and col >= corner:
+            result = (2, row - corner, col - corner)
+        elif s == 1 and row >= corner and col < rho:
+            result = (2, row - corner, col + corner)
+        elif s == 3 and row < rho and col >= corner:
+            result = (2, row + corner, col - corner)
+        elif s == 4 and row < rho and col < rho:
+            result = (2, row + corner, col + corner)
+        return result
+
+    @property
+    def Grid(self):
+        return self.grid
+
+    @property
+    def GridTopology(self):
+        return self.gridTopology
+
+    @property
+    def CellIds(self):
+        return self.cellIds
+
+def GetSamuraiTopology(dimension, grid):
+    key = ('Samurai', dimension, grid)
+    topology = _topologies.get(key)
+    if topology is None:
+        topology = SamuraiTopology(dimension, grid)
+        _topologies[key] = topology
+    return topology
@@ -0,0 +1,65 @@
+import collections
+import functools
+import itertools
+import os
+
+from batch.pipeline import Pipeline, Puzzles, Parse, Validate, Solve, Serialize
+from batch.pipeline import SOLVED, NO_SOLUTION, EXHAUSTED, INVALID
+from normal import normal
+
+def SolveStages(parse, serialize, engine, maxNodes):
+    # The stages of the pipeline from puzzle text to solution text
+    return [ functools.partial(Parse, parse=parse), Validate
+           , functools.partial(Solve, engine=engine, maxNodes=maxNodes)
+           , functools.partial(Serialize, serialize=serialize)]
+
+def SolvePuzzle(index, puzzle, parse=normal.createSudokuFromLine, serialize=normal.lineFromSudoku
+                , engine='dlx', maxNodes=None):
+    return next(Pipeline(Puzzles([puzzle], index), *SolveStages(parse, serialize, engine, maxNodes)))
+
+def SolveChunk(start, puzzles, parse, serialize, engine, maxNodes):
+    # Solves a chunk of puzzles in a worker process, start is the index of the first
+    return list(Pipeline(Puzzles(puzzles, start), *SolveStages(parse, serialize, engine, maxNodes)))
+
+def Chunks(puzzles, chunkSize):
+    # Yields (index of first puzzle, list of puzzles) of the puzzle stream
+    iterator = iter(puzzles)
+    start = 0
+    chunk = list(itertools.islice(iterator, chunkSize))
+    while chunk != []:
+        yield start, chunk
+        start += len(chunk)
+        chunk = list(itertools.islice(iterator, chunkSize))
+
+def SolveBatch(puzzles, workers=None, chunkSize=64, parse=normal.createSudokuFromLine
+               , serialize=normal.lineFromSudoku, engine='dlx', maxNodes=None):
+    # Solves the stream of puzzles in chunks of chunkSize in worker processes and yields
+    # a solved pipeline.Puzzle for each in input order. Puzzles are independent and
+    # CPU-bound, so processes are used, not threads. At most two chunks for each worker
+    # are in flight, so the stream is read lazily. workers=1 runs the pipeline in this
+    # process. parse and serialize must be module level functions, so they can be sent
+    # to the workers.
+    if chunkSize < 1:
+        raise ValueError("Chunk size must be positive: " + str(chunkSize))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Workers must be positive: " + str(workers))
+    if workers == 1:
+        yield from Pipeline(Puzzles(puzzles), *SolveStages(parse, serialize, engine, maxNodes))
+    else:
+        # imported here, starting the command line solver in one process must be fast
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = collections.deque()
+            for start, chunk in Chunks(puzzles, chunkSize):
+                pending.append(executor.submit(SolveChunk, start, chunk, parse, serialize, engine, maxNodes))
+                if len(pending) >= 2*workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+def WriteResults(results, out):
+    # Writes a line for each result: index, status, seconds and solution separated by tabs
+    for result in results:
+        out.write("%d\t%s\t%.6f\t%s\n" % (result.Index, result.Status, result.Seconds, result.Solution or result.Message))
@@ -0,0 +1,167 @@
+import sys
+import time
+
+from basesudoku import search
+from normal import normal
+
+# Lazy pipeline of puzzles. Each stage is a generator function, that takes the puzzles
+# of the stage before and yields them on, so a file of any size is solved in constant
+# memory. Stages with parameters are put in a pipeline with functools.partial, e.g.
+#   Pipeline(Puzzles(ReadLines(files)), Parse, Validate, functools.partial(Solve, engine='rules'), Serialize)
+# A puzzle, that failed in a stage, has a status and is passed on untouched by later stages.
+
+# Status of a puzzle
+SOLVED = 'solved'
+NO_SOLUTION = 'nosolution' # the search proved there is no solution
+EXHAUSTED = 'exhausted'    # the search stopped at maxNodes
+INVALID = 'invalid'        # the puzzle can't be parsed or breaks the rules
+
+class Puzzle:
+    # A puzzle in the pipeline, index is the position in the input
+    def __init__(self, index, text):
+        self.index = index
+        self.text = text
+        self.sudoku = None
+        self.status = None     # None while no stage has decided
+        self.solution = None   # serialized solution, None when not solved
+        self.seconds = 0.0     # time spent in the stages
+        self.message = ''
+
+    @property
+    def Index(self):
+        return self.index
+
+    @property
+    def Text(self):
+        return self.text
+
+    @property
+    def Sudoku(self):
+        return self.sudoku
+
+    @property
+    def Status(self):
+        return self.status
+
+    @property
+    def Solution(self):
+        return self.solution
+
+    @property
+    def Seconds(self):
+        return self.seconds
+
+    @property
+    def Message(self):
+        return self.message
+
+def ReadLines(files):
+    # Yields the lines of the files, '-' is stdin.
+    # Empty lines and comments starting with # are skipped.
+    for name in files:
+        f = sys.stdin if name == '-' else open(name)
+        try:
+            for line in f:
+                line = line.strip()
+                if line != '' and not line.startswith('#'):
+                    yield line
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+def Puzzles(lines, start=0):
+    # Yields a puzzle for each line, start is the index of the first
+    index = start
+    for line in lines:
+        yield Puzzle(index, line)
+        index += 1
+
+def Parse(puzzles, parse=normal.createSudokuFromLine):
+    for puzzle in puzzles:
+        if puzzle.status is None:
+            start = time.perf_counter()
+            try:
+                puzzle.sudoku = parse(puzzle.text)
+            except ValueError as error:
+                puzzle.status = INVALID
+                puzzle.message = str(error)
+            puzzle.seconds += time.perf_counter() - start
+        yield puzzle
+
+def Validate(puzzles):
+    for puzzle in puzzles:
+        if puzzle.status is None:
+            start = time.perf_counter()
+            if not puzzle.sudoku.Check():
+                puzzle.status = INVALID
+                puzzle.message = 'Same number twice in a row, column or group'
+            puzzle.seconds += time.perf_counter() - start
+        yield puzzle
+
+def Propagate(puzzles, chunkSize=1024):
+    # Propagates chunks of parsed puzzles with NumPy, puzzles of the same topology in one
+    # batch, so fewer are left for Solve. A puzzle found without a solution gets the status
+    # NO_SOLUTION. Needs NumPy, see numpyEngine.
+    chunk = []
+    for puzzle in puzzles:
+        chunk.append(puzzle)
+        if len(chunk) == chunkSize:
+            yield from PropagateChunk(chunk)
+            chunk = []
+    yield from PropagateChunk(chunk)
+
+def PropagateChunk(chunk):
+    # imported here, so NumPy is only loaded when the stage is used
+    from basesudoku import numpyEngine
+    start = time.perf_counter()
+    batches = {}
+    for puzzle in chunk:
+        if puzzle.status is None:
+            batches.setdefault(puzzle.sudoku.Topology, []).append(puzzle)
+    for batch in batches.values():
+        boards = numpyEngine.Boards([puzzle.sudoku for puzzle in batch])
+        boards.Propagate()
+        for b in range(len(batch)):
+            if boards.Contradiction[b]:
+                batch[b].status = NO_SOLUTION
+            else:
+                numpyEngine.WriteBack(boards, b, batch[b].sudoku)
+    # the time is shared by the puzzles of the chunk
+    seconds = (time.perf_counter() - start) / max(len(chunk), 1)
+    for puzzle in chunk:
+        puzzle.seconds += seconds
+    return chunk
+
+def Solve(puzzles, engine='dlx', maxNodes=None):
+    # The search of the engine tells, whether it stopped at maxNodes or proved there
+    # is no solution, see search.Solve
+    if not engine in search.ENGINES:
+        raise ValueError("Unknown solver engine: " + str(engine))
+    for puzzle in puzzles:
+        if puzzle.status is None:
+            start = time.perf_counter()
+            solver = search.ENGINES[engine](puzzle.sudoku, maxNodes)
+            if solver.Run():
+                puzzle.status = SOLVED
+            elif solver.Exhausted:
+                puzzle.status = EXHAUSTED
+            else:
+                puzzle.status = NO_SOLUTION
+            puzzle.seconds += time.perf_counter() - start
+        yield puzzle
+
+def Serialize(puzzles, serialize=normal.lineFromSudoku):
+    # Puts the solution as text and lets go of the sudoku
+    for puzzle in puzzles:
+        if puzzle.status == SOLVED:
+            start = time.perf_counter()
+            puzzle.solution = serialize(puzzle.sudoku)
+            puzzle.seconds += time.perf_counter() - start
+        puzzle.sudoku = None
+        yield puzzle
+
+def Pipeline(puzzles, *stages):
+    # Chains the stages on the puzzles, the first stage gets the puzzles
+    for stage in stages:
+        puzzles = stage(puzzles)
+    return puzzles
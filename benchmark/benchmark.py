@@ -0,0 +1,154 @@
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from basesudoku import lineFormat
+from jigsaw import jigsaw
+from normal import normal
+from samurai import samurai
+
+# Benchmark of the steps of solving for all sudoku types and sizes, run with
+#   python -m benchmark.benchmark --output results.json [--baseline old.json]
+# Results are JSON, so runs can be compared, see Compare.
+
+HARD9 = '4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......'
+
+def PatternLine(dimension, blanks, seed):
+    # A normal sudoku from a shuffled pattern solution with blanks part of the cells empty
+    rng = random.Random(seed)
+    rho = round(math.sqrt(dimension))
+    numbers = list(range(1, dimension + 1))
+    rng.shuffle(numbers)
+    rows = [b*rho + r for b in rng.sample(range(rho), rho) for r in rng.sample(range(rho), rho)]
+    columns = [b*rho + c for b in rng.sample(range(rho), rho) for c in rng.sample(range(rho), rho)]
+    grid = [numbers[(rho*(r % rho) + r//rho + c) % dimension] for r in rows for c in columns]
+    for i in rng.sample(range(len(grid)), round(blanks*len(grid))):
+        grid[i] = 0
+    return lineFormat.FormatGrid(grid)
+
+def Cases():
+    # (name, parse, puzzle lines) of each benchmark case
+    return [ ('normal4', normal.createSudokuFromLine, [PatternLine(4, 0.6, seed) for seed in range(4)])
+           , ('normal9', normal.createSudokuFromLine, [normal.lineFromSudoku(create()) for create in
+                                                       (normal.createSudoku1, normal.createSudoku2, normal.createSudoku3)] + [HARD9])
+           , ('normal16', normal.createSudokuFromLine, [PatternLine(16, 0.5, seed) for seed in range(2)])
+           , ('normal25', normal.createSudokuFromLine, [PatternLine(25, 0.4, seed) for seed in range(1)])
+           , ('jigsaw9', jigsaw.createSudokuFromLine, [jigsaw.lineFromSudoku(jigsaw.createSudoku())])
+           , ('samurai9', samurai.createSudokuFromLine, [samurai.lineFromSudoku(samurai.createSudoku())]) ]
+
+def Propagated(parse, line):
+    sudoku = parse(line)
+    sudoku.FindPossibleCandidates()
+    sudoku.DoChange()
+    return sudoku
+
+def Solved(parse, line):
+    sudoku = parse(line)
+    sudoku.Solve(engine='dlx')
+    return sudoku
+
+def FindNakedPairs(sudoku):
+    sudoku.FindNakedPairsRow()
+    sudoku.FindNakedPairsColumn()
+    sudoku.FindNakedPairsGroup()
+
+def Steps(parse, line):
+    # (name, setup, action) of each step, setup isn't timed, action is timed on its result
+    sudoku = parse(line)
+    steps = [ ('construct', lambda: line, parse)
+            , ('findPossibleCandidates', lambda: parse(line), lambda s: s.FindPossibleCandidates())
+            , ('setSingles', lambda: Propagated(parse, line), lambda s: s.SetSingles()) ]
+    if hasattr(sudoku, 'FindNakedPairsRow'):
+        steps.append(('findNakedPairs', lambda: Propagated(parse, line), FindNakedPairs))
+    steps += [ ('solveRules', lambda: parse(line), lambda s: s.Solve(engine='rules'))
+             , ('solveDlx', lambda: parse(line), lambda s: s.Solve(engine='dlx'))
+             , ('check', lambda: Solved(parse, line), lambda s: s.Check()) ]
+    return steps
+
+def Percentile(samples, p):
+    # Nearest rank percentile of sorted samples
+    return samples[max(0, math.ceil(p/100*len(samples)) - 1)]
+
+def Summary(samples):
+    samples = sorted(samples)
+    total = sum(samples)
+    return { 'count': len(samples), 'mean': total/len(samples), 'p50': Percentile(samples, 50)
+           , 'p90': Percentile(samples, 90), 'p99': Percentile(samples, 99), 'max': samples[-1]
+           , 'perSecond': len(samples)/total if total > 0 else None }
+
+def PeakMemory(setup, action):
+    # Peak bytes allocated by the action, measured apart from the timing
+    value = setup()
+    tracemalloc.start()
+    action(value)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def RunCase(name, parse, lines, repeat):
+    samples = {}
+    peaks = {}
+    for line in lines:
+        for step, setup, action in Steps(parse, line):
+            samples.setdefault(step, [])
+            for r in range(repeat):
+                value = setup()
+                start = time.perf_counter()
+                action(value)
+                samples[step].append(time.perf_counter() - start)
+            peaks[step] = max(peaks.get(step, 0), PeakMemory(setup, action))
+    return { 'name': name, 'puzzles': len(lines)
+           , 'steps': {step: dict(Summary(samples[step]), peakMemory=peaks[step]) for step in samples} }
+
+def Run(repeat=5, names=None):
+    # Runs the cases, all when names is None, and returns the results
+    cases = []
+    for name, parse, lines in Cases():
+        if names is None or name in names:
+            cases.append(RunCase(name, parse, lines, repeat))
+    return { 'python': platform.python_version(), 'platform': platform.platform()
+           , 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'repeat': repeat, 'cases': cases }
+
+def Compare(baseline, results, tolerance=0.2):
+    # Returns (case, step, baseline p50, p50) for steps more than tolerance slower than the baseline
+    regressions = []
+    old = {case['name']: case['steps'] for case in baseline['cases']}
+    for case in results['cases']:
+        for step, summary in case['steps'].items():
+            before = old.get(case['name'], {}).get(step)
+            if before is not None and summary['p50'] > before['p50']*(1 + tolerance):
+                regressions.append((case['name'], step, before['p50'], summary['p50']))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='benchmark', description='Benchmark of the sudoku solver')
+    parser.add_argument('--output', default='-', help="JSON results file, '-' is stdout (default)")
+    parser.add_argument('--repeat', type=int, default=5, help='times each step is run on each puzzle')
+    parser.add_argument('--cases', default=None, help='comma separated case names, default all: '
+                        + ','.join(case[0] for case in Cases()))
+    parser.add_argument('--baseline', default=None, help='JSON results to compare with')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slow down of median times')
+    args = parser.parse_args(argv)
+    results = Run(args.repeat, args.cases.split(',') if args.cases else None)
+    text = json.dumps(results, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    result = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for name, step, before, after in Compare(baseline, results, args.tolerance):
+            print("Regression %s %s: median %.6f s was %.6f s" % (name, step, after, before), file=sys.stderr)
+            result = 1
+    return result
+
+if __name__ == '__main__':
+    sys.exit(main())
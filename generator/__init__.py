@@ -0,0 +1,5 @@
+# Grades by the highest cost of the rules needed, see Rules of the sudokus. A puzzle the
+# rules can't solve without search is 'expert'. Here, so the command line knows them
+# without importing the generator.
+GRADES = (('easy', 3), ('medium', 15), ('hard', 35))
+EXPERT = 'expert'
@@ -0,0 +1,238 @@
+import collections
+import os
+import random
+
+from basesudoku import lineFormat
+from basesudoku.basecell import CandidatesFromMask
+from basesudoku.exactCover import ExactCover, CountCovers
+from basesudoku.instrumentation import CallbackSink, RuleName
+from basesudoku.topology import GetTopology, GetSamuraiTopology
+from batch.batchSolver import Chunks
+from generator import GRADES, EXPERT
+from jigsaw import jigsaw
+from normal import normal
+from samurai import samurai
+
+# Generator of puzzles with a unique solution. A random complete grid is made with
+# dancing links, then clues are removed in random order as long as the solution stays
+# unique. The puzzle is graded by the hardest rule the rule pipeline needs to solve it.
+# All randomness comes from a random.Random seeded with the seed and the index of the
+# puzzle, so a batch is the same for any number of workers. The grades are in the
+# generator package, see GRADES.
+
+# Parse of the line of each sudoku type
+PARSE = { 'normal': normal.createSudokuFromLine
+        , 'jigsaw': jigsaw.createSudokuFromLine
+        , 'samurai': samurai.createSudokuFromLine }
+
+class Layout:
+    # What to generate: the type of sudoku, its dimension and for jigsaw the shape, a
+    # list of rows of the group of each cell
+    def __init__(self, type='normal', dimension=9, shape=None):
+        if not type in PARSE:
+            raise ValueError("Unknown sudoku type: " + str(type))
+        if (type == 'jigsaw') != (shape is not None):
+            raise ValueError("A shape is needed for jigsaw sudokus only")
+        self.type = type
+        self.dimension = dimension
+        self.shape = shape
+        self.size = self.Topology.Size # number of cells
+        # a jigsaw shape may have no solution, checked once, RandomSolution would try for ever
+        if shape is not None and CountCovers(self.Topology, [0]*self.size, 1) == 0:
+            raise ValueError("No sudoku can be made with the shape")
+
+    @property
+    def Type(self):
+        return self.type
+
+    @property
+    def Dimension(self):
+        return self.dimension
+
+    @property
+    def Shape(self):
+        return self.shape
+
+    @property
+    def Size(self):
+        return self.size
+
+    @property
+    def Topology(self):
+        # from the registry, so a layout sent to a worker process stays small
+        if self.type == 'samurai':
+            result = GetSamuraiTopology(self.dimension, 5)
+        else:
+            result = GetTopology(self.dimension, self.shape)
+        return result
+
+    def Line(self, numbers):
+        # The line of the numbers of the cells by cell id, 0 is an empty cell
+        if self.type == 'samurai':
+            cellIds = self.Topology.CellIds
+            result = ' '.join([lineFormat.FormatGrid([numbers[i] for i in ids]) for ids in cellIds])
+        else:
+            result = lineFormat.FormatGrid(numbers)
+            if self.type == 'jigsaw':
+                result = result + ' ' + lineFormat.FormatShape(self.shape)
+        return result
+
+    def Parse(self, line):
+        return PARSE[self.type](line)
+
+class Generated:
+    # A generated puzzle, index is the position in the batch and target the grade asked
+    # for, None for any grade
+    def __init__(self, index, line, solution, clues, grade, rules, target=None):
+        self.index = index
+        self.line = line
+        self.solution = solution
+        self.clues = clues
+        self.grade = grade
+        self.rules = rules
+        self.target = target
+
+    @property
+    def Index(self):
+        return self.index
+
+    @property
+    def Line(self):
+        return self.line
+
+    @property
+    def Solution(self):
+        return self.solution
+
+    @property
+    def Clues(self):
+        return self.clues
+
+    @property
+    def Grade(self):
+        return self.grade
+
+    @property
+    def Rules(self):
+        # names of the rules needed to solve the puzzle, cheapest first
+        return self.rules
+
+    @property
+    def Target(self):
+        return self.target
+
+    @property
+    def Missed(self):
+        # True when no puzzle of the target grade was found within the attempts
+        return self.target is not None and self.grade != self.target
+
+def RandomSolution(layout, rng):
+    # Numbers of a random complete grid by cell id. A number for each of dimension random
+    # cells is chosen without breaking the units, and dancing links completes the grid.
+    # The numbers are shuffled at the end, any permutation of a solution is a solution.
+    topology = layout.Topology
+    dimension = layout.Dimension
+    full = (1 << dimension) - 1
+    solutions = []
+    while solutions == []:
+        numbers = [0]*layout.Size
+        used = [0]*len(topology.Units)
+        for i in rng.sample(range(layout.Size), dimension):
+            free = full
+            for unit in topology.CellUnits[i]:
+                free &= ~used[unit]
+            if free != 0:
+                numbers[i] = rng.choice(CandidatesFromMask(free))
+                for unit in topology.CellUnits[i]:
+                    used[unit] |= 1 << (numbers[i]-1)
+        links, rowIds, selected = ExactCover(topology, numbers)
+        if all(links.Select(row) for row in selected):
+            # a bad start is given up soon, another one is tried
+            solutions = list(links.Search(1, 100*layout.Size))
+    for row in solutions[0]:
+        numbers[rowIds[row] // dimension] = rowIds[row] % dimension + 1
+    permutation = list(range(1, dimension+1))
+    rng.shuffle(permutation)
+    return [permutation[n-1] for n in numbers]
+
+def RemoveClues(layout, solution, rng, minClues=0):
+    # Numbers of a puzzle with the unique solution, clues are removed in random order
+    # until each clue left is needed or minClues are left
+    numbers = list(solution)
+    clues = len(numbers)
+    order = list(range(len(numbers)))
+    rng.shuffle(order)
+    for i in order:
+        if clues > minClues:
+            number = numbers[i]
+            numbers[i] = 0
+            if CountCovers(layout.Topology, numbers) == 1:
+                clues -= 1
+            else:
+                numbers[i] = number
+    return numbers
+
+def Grade(layout, line):
+    # (grade, names of the rules needed) of the puzzle. A rule is needed, when it changes
+    # the sudoku, the pipeline tries a rule only when all cheaper ones found nothing.
+    sudoku = layout.Parse(line)
+    changed = set()
+    sudoku.Instrument(CallbackSink(lambda record: changed.add(record.Rule) if record.Changed else None))
+    solved = sudoku.Pipeline.Run() and sudoku.Solved
+    rules = [rule for rule in sudoku.Pipeline.Rules if RuleName(rule.Method) in changed]
+    rules.sort(key=lambda rule: rule.Cost)
+    grade = EXPERT
+    if solved:
+        hardest = max([rule.Cost for rule in rules], default=0)
+        for name, cost in reversed(GRADES):
+            if hardest <= cost:
+                grade = name
+    return grade, [rule.Name for rule in rules]
+
+def Generate(layout, index=0, seed=0, grade=None, minClues=0, attempts=20):
+    # Generates the puzzle with index of a batch. With grade, up to attempts puzzles are
+    # made until one has the grade, otherwise the last one is returned with its grade
+    # and Missed tells so.
+    if attempts < 1:
+        raise ValueError("Attempts must be positive: " + str(attempts))
+    rng = random.Random("%s-%d" % (seed, index))
+    result = None
+    attempt = 0
+    while attempt < attempts and (result is None or (grade is not None and result.Grade != grade)):
+        solution = RandomSolution(layout, rng)
+        numbers = RemoveClues(layout, solution, rng, minClues)
+        line = layout.Line(numbers)
+        puzzleGrade, rules = Grade(layout, line)
+        result = Generated(index, line, layout.Line(solution), len(numbers) - numbers.count(0), puzzleGrade, rules, grade)
+        attempt += 1
+    return result
+
+def GenerateChunk(start, count, layout, seed, grade, minClues, attempts):
+    # Generates a chunk of puzzles in a worker process, start is the index of the first
+    return [Generate(layout, start + i, seed, grade, minClues, attempts) for i in range(count)]
+
+def GenerateBatch(layout, count, seed=0, grade=None, workers=None, chunkSize=4, minClues=0, attempts=20):
+    # Yields count generated puzzles in index order, generated in chunks of chunkSize in
+    # worker processes, see batchSolver.SolveBatch. workers=1 generates in this process.
+    if chunkSize < 1:
+        raise ValueError("Chunk size must be positive: " + str(chunkSize))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Workers must be positive: " + str(workers))
+    if attempts < 1:
+        raise ValueError("Attempts must be positive: " + str(attempts))
+    if workers == 1:
+        for index in range(count):
+            yield Generate(layout, index, seed, grade, minClues, attempts)
+    else:
+        # imported here like in batchSolver
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = collections.deque()
+            for start, chunk in Chunks(range(count), chunkSize):
+                pending.append(executor.submit(GenerateChunk, start, len(chunk), layout, seed, grade, minClues, attempts))
+                if len(pending) >= 2*workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
@@ -1,3 +1,4 @@
+from basesudoku import lineFormat
 from jigsaw.jigsawSudoku import JigsawSudoku
 
 def createSudoku():
@@ -35,3 +36,26 @@ def createSudoku():
     sudoku.Set( 8, 8, 5, True)
     sudoku.DoChange() # set the changes
     return sudoku
+
+def createSudokuFromLine(line):
+    # Jigsaw sudoku from a line of the grid and the shape separated by a space, the
+    # shape has a letter for the group of each cell, 'A' is group 0, see lineFormat.
+    parts = line.split()
+    if len(parts) != 2:
+        raise ValueError("Jigsaw line must have grid and shape")
+    dimension = lineFormat.GridDimension(parts[0])
+    if len(parts[1]) != len(parts[0]):
+        raise ValueError("Jigsaw shape length differs from grid: " + str(len(parts[1])))
+    numbers = lineFormat.ParseGrid(parts[0], dimension)
+    groups = lineFormat.ParseGrid(parts[1], dimension - 1, lineFormat.GROUPS)
+    shape = [groups[r*dimension:(r+1)*dimension] for r in range(dimension)]
+    sudoku = JigsawSudoku( dimension, shape)
+    for i in range(len(numbers)):
+        if numbers[i]:
+            sudoku.Set( i // dimension, i % dimension, numbers[i], True)
+    sudoku.DoChange()
+    return sudoku
+
+def lineFromSudoku(sudoku):
+    # The line of the jigsaw sudoku, see createSudokuFromLine
+    return lineFormat.FormatGrid([cell.Number for cell in sudoku.Cells]) + ' ' + lineFormat.FormatShape(sudoku.shape)
@@ -1,5 +1,6 @@
 from basesudoku.basesudoku import BaseSudoku
 from basesudoku.basecell import BaseCell
+from basesudoku.topology import GetTopology
 
 class JigsawSudoku(BaseSudoku):
     def __init__(self, dimension, shape): 
@@ -7,14 +8,14 @@ class JigsawSudoku(BaseSudoku):
         # shape is d=nxn row and columns with group indexes 0 based, n=sqrt(d), 
         # where 0 is first group at upper left corner and n is last
         self.shape = shape # forms the jigsaw
-        super().__init__(dimension, self.createCell, 'Jigsaw')
+        self.dimension = dimension
         shapeCheck = self.CheckShape(shape) # returns tuple (bool, message)
         if not shapeCheck[0]:
             raise ValueError("Shape check failed: " + shapeCheck[1])
-        self.state = 0
+        super().__init__(dimension, self.createCell, 'Jigsaw', GetTopology(dimension, shape))
 
-    def createCell(self, dim, row, col):
-        cell = BaseCell( dim, row, col, self.shape[row][col])
+    def createCell(self, dim, row, col, board):
+        cell = BaseCell( dim, row, col, self.shape[row][col], board)
         return cell
 
     def CheckShape(self, shape): # returns tuple (bool, message)
@@ -41,57 +42,12 @@ class JigsawSudoku(BaseSudoku):
                 break
         return (result, msg)
     
-    def GetState( self):
-        return self.state
-
     def GetGroup( self, r, c):
         return self.sudoku[r][c].Group
 
-    def RemoveCandidatesHook( self, cell):
-        self.RemoveCandidatesInGroupForNumber( cell.Group, cell.Number)
-
     def FindPossibleCandidates(self):
-        self.FindPossibleCandidatesBase(self.RemoveCandidatesHook)
+        # removes candidates from the peers of solved cells
+        self.FindPossibleCandidatesBase()
 
     def SetSingles(self):
         self.FindSinglesBase(self.FindSinglesGroup) # uses standard base hook
-
-    # TODO DRY - all sudokus do this
-    def TakeStep(self):
-        self.steps = { 0: 'Set single candidate as solution in cells', 1: 'Find possible candidates'
-                , 2: 'Find single candidate in row, column and group', 3: 'Update sudoku'
-                , 4: "Done, solved"}
-        if not self.Solved:
-            result = self.steps[self.state]
-            match self.state:
-                case 0:
-                    self.SetSingleCandidatesAsnewNumber()
-                    if self.Changed:
-                        result = result + ", yes"
-                        self.state = 3
-                    else:
-                        result = result + ", no"
-                        self.state = 1
-                case 1:
-                    self.FindPossibleCandidates()
-                    if self.Changed:
-                        result = result + ", yes"
-                        self.state = 3
-                    else:
-                        result = result + ", no"
-                        self.state = 2
-                case 2:
-                    self.SetSingles()
-                    if self.Changed:
-                        result = result + ", yes"
-                        self.state = 3
-                    else:
-                        result = result + ", no"
-                    self.state = 3
-                case 3:
-                    self.DoChange()
-                    self.state = 0
-        else:
-            result = self.steps[4]
-
-        return result
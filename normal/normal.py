@@ -1,3 +1,4 @@
+from basesudoku import lineFormat
 from normal.normalSudoku import NormalSudoku
 
 def createSudoku():
@@ -132,3 +133,20 @@ def createSudoku3():
     sudoku.Set( 8, 7, 2,True)
     sudoku.DoChange()
     return sudoku
+
+def createSudokuFromLine(line):
+    # Sudoku from a line of dimension*dimension symbols row by row, see lineFormat
+    line = line.strip()
+    dimension = lineFormat.GridDimension(line)
+    lineFormat.BoxDimension(dimension)
+    numbers = lineFormat.ParseGrid(line, dimension)
+    sudoku = NormalSudoku(dimension)
+    for i in range(len(numbers)):
+        if numbers[i]:
+            sudoku.Set( i // dimension, i % dimension, numbers[i], True)
+    sudoku.DoChange()
+    return sudoku
+
+def lineFromSudoku(sudoku):
+    # The line of the sudoku, see createSudokuFromLine
+    return lineFormat.FormatGrid([cell.Number for cell in sudoku.Cells])
@@ -1,4 +1,6 @@
+from basesudoku import lineFormat
 from samurai.samuraiSudoku import SamuraiSudoku
+
 def createSudoku():
     grid = 5
     dimension = 9
@@ -68,3 +70,30 @@ def createSudoku():
 
     sudoku.DoChange() # set the changes
     return sudoku
+
+def createSudokuFromLine(line):
+    # Samurai sudoku from a line of the five grids, upper left, upper right, middle, lower
+    # left and lower right, each like a normal sudoku line, separated by spaces or not.
+    # The shared corners may be given in one or both grids.
+    grid = 5
+    text = ''.join(line.split())
+    if len(text) % grid != 0:
+        raise ValueError("Bad samurai line length: " + str(len(text)))
+    size = len(text) // grid
+    dimension = lineFormat.GridDimension(text[:size])
+    lineFormat.BoxDimension(dimension)
+    sudoku = SamuraiSudoku( dimension, grid)
+    for s in range(grid):
+        numbers = lineFormat.ParseGrid(text[s*size:(s+1)*size], dimension)
+        for i in range(size):
+            if numbers[i]:
+                cell = sudoku.Sudokus[s].Sudoku[i // dimension][i % dimension]
+                if cell.hasShared and cell.shared.Number not in (0, numbers[i]):
+                    raise ValueError("Shared cell differs in samurai grid " + str(s))
+                sudoku.Set( s, i // dimension, i % dimension, numbers[i], True)
+    sudoku.DoChange()
+    return sudoku
+
+def lineFromSudoku(sudoku):
+    # The line of the samurai sudoku, see createSudokuFromLine
+    return ' '.join([lineFormat.FormatGrid([cell.Number for cell in grid.Cells]) for grid in sudoku.Sudokus])
@@ -1,8 +1,10 @@
 from basesudoku.basecell import BaseCell
 
 class SamuraiCell(BaseCell):
-    def __init__(self, dim, row, col, group):
-        super().__init__(dim, row, col, group)
+    __slots__ = ('shared', 'hasShared')
+
+    def __init__(self, dim, row, col, group, board=None):
+        super().__init__(dim, row, col, group, board)
         self.SetShared(None)
 
     def SetShared(self, shared):
@@ -11,7 +13,7 @@ class SamuraiCell(BaseCell):
    
     @property
     def Number(self):
-        return self.number
+        return self.board.numbers[self.index]
     
     @BaseCell.Number.setter
     def Number(self, n):
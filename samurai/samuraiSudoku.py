@@ -1,9 +1,12 @@
 from basesudoku.basesudoku import BaseSudoku
 from samurai.samuraiCell import SamuraiCell
+from basesudoku.topology import GetSamuraiTopology
+from basesudoku.sudokuDriver import SudokuDriver
+from basesudoku.rulePipeline import Rule
 import math
 import functools
 
-class SamuraiSudoku():
+class SamuraiSudoku(SudokuDriver):
     def __init__(self, dimension, grid):
         # grid can be 5 for normal samurai 2x2+(2-1)^2
         # TODO 8 for super samurai 3x2+3-1
@@ -15,13 +18,23 @@ class SamuraiSudoku():
         self.sudokus = []
         self.dimension = dimension
         self.grid = grid
-        self.state = 0        
         self.rho = round(math.sqrt(self.dimension)) 
         self.type = 'Samurai'
+        self.sinks = [] # sinks of the rule instrumentation, see Instrument
+        self.pipeline = None # made from Rules on first use, see Pipeline
+        self.topology = GetSamuraiTopology(dimension, grid)
+        self.gridTopology = self.topology.GridTopology # the grid sudokus are normal sudokus
         # Create grid sudokus
         for s in range(grid):
-            sudoku = BaseSudoku(dimension, self.createCell, self.type)
+            sudoku = BaseSudoku(dimension, self.createCell, self.type, self.gridTopology)
             self.sudokus.append(sudoku)
+        self.boards = [sudoku.Board for sudoku in self.sudokus] # see SudokuDriver
+        # One cell for each cell id of the topology, the cell of the first grid when shared
+        self.cells = [None]*self.topology.Size
+        for s in range(grid):
+            for i, cell in enumerate(self.sudokus[s].Cells):
+                if self.cells[self.topology.CellIds[s][i]] is None:
+                    self.cells[self.topology.CellIds[s][i]] = cell
         # TODO Set shared cells for all grids
         # Set upper left corner cells of sudoku 2 in the middle to be shared with sudoku 0 lower right corner        
         self.SetSharedCells(self.sudokus[2].Sudoku, 0, 0, self.sudokus[0].Sudoku,  self.dimension-self.rho, self.dimension-self.rho)
@@ -40,9 +53,9 @@ class SamuraiSudoku():
                 cellMiddle.SetShared(cell)
                 cell.SetShared(cellMiddle)
 
-    def createCell(self, dim, rw, cl):        
-        group = (rw//self.rho)*self.rho + (cl//self.rho) # upper left square is indexed 0, next to the right 1, and so forth.
-        cell = SamuraiCell( dim, rw, cl, group)      
+    def createCell(self, dim, rw, cl, board):
+        group = self.gridTopology.Group(rw, cl) # upper left square is indexed 0, next to the right 1, and so forth.
+        cell = SamuraiCell( dim, rw, cl, group, board) # in the board of the grid sudoku
         return cell
 
     @property
@@ -79,6 +92,39 @@ class SamuraiSudoku():
         for sudoku in self.sudokus:
             sudoku.DoChange()
 
+    def Check(self):
+        # Check constraints of all grid sudokus are fulfilled
+        result = True
+        for sudoku in self.sudokus:
+            result = result and sudoku.Check()
+            if not result:
+                break
+        return result
+
+    @property
+    def Contradiction(self):
+        result = False
+        for sudoku in self.sudokus:
+            result = result or sudoku.Contradiction
+        return result
+
+    @property
+    def Topology(self):
+        return self.topology
+
+    @property
+    def Cells(self):
+        # Cells in the order of the cell ids of the topology, a shared cell appears once
+        return self.cells
+
+    @property
+    def Boards(self):
+        return self.boards
+
+    def NakedPairRules(self):
+        # The naked pairs in all units of the grid sudokus, see SudokuDriver.Rules
+        return [ Rule('Find naked pairs', self.FindNakedPairs, 10) ]
+
     def SetSingleCandidatesAsnewNumber(self):
         for sudoku in self.sudokus:
             sudoku.SetSingleCandidatesAsnewNumber()
@@ -88,19 +134,62 @@ class SamuraiSudoku():
         return self.sudokus
     
     def Set( self, sudokuIndex, row, col, number, isInitial=False):
-        self.sudokus[sudokuIndex].Sudoku[row][col].SetNumber(number, isInitial)
+        cell = self.sudokus[sudokuIndex].Sudoku[row][col]
+        cell.SetNumber(number, isInitial)
+        if isInitial and cell.hasShared:
+            # the shared cell in the other grid gets the same initial number
+            cell.shared.SetNumber(number, isInitial)
 
     def RemoveCandidatesHook( self, cellWithCandidate, sudoku):
-        sudoku.RemoveCandidatesInGroupForNumber(cellWithCandidate.group, cellWithCandidate.Number)
-    
-    def makeRemoveCandidatesHook( self, sudoku):
-        return functools.partial(self.RemoveCandidatesHook, sudoku=sudoku)
+        sudoku.RemoveCandidatesInGroupForNumber(cellWithCandidate.Group, cellWithCandidate.Number)
 
     def FindPossibleCandidates(self):
         for sudoku in self.sudokus:
-            removeCandidatesHook = self.makeRemoveCandidatesHook(sudoku)
-            sudoku.FindPossibleCandidatesBase(removeCandidatesHook)
-            # TODO this is standard base sudoku rule. Samurai rule is different for shared corners
+            # removes candidates from the peers of solved cells
+            sudoku.FindPossibleCandidatesBase()
+
+    def FindLockedCandidates(self):
+        for sudoku in self.sudokus:
+            sudoku.FindLockedCandidates()
+
+    def FindNakedSubsets(self, size):
+        # in all units of all grid sudokus, removals in shared cells go to both grids
+        for sudoku in self.sudokus:
+            sudoku.FindNakedSubsets(range(len(sudoku.Topology.Units)), size)
+
+    def FindNakedPairs(self):
+        self.FindNakedSubsets(2)
+
+    def FindNakedTriples(self):
+        self.FindNakedSubsets(3)
+
+    def FindNakedQuads(self):
+        self.FindNakedSubsets(4)
+
+    def FindHiddenSubsets(self, size):
+        # in all units of all grid sudokus, removals in shared cells go to both grids
+        for sudoku in self.sudokus:
+            sudoku.FindHiddenSubsets(range(len(sudoku.Topology.Units)), size)
+
+    def FindHiddenPairs(self):
+        self.FindHiddenSubsets(2)
+
+    def FindHiddenTriples(self):
+        self.FindHiddenSubsets(3)
+
+    def FindFish(self, size):
+        # rows and columns of each grid sudoku, removals in shared cells go to both grids
+        for sudoku in self.sudokus:
+            sudoku.FindFish(size)
+
+    def FindXWings(self):
+        self.FindFish(2)
+
+    def FindSwordfish(self):
+        self.FindFish(3)
+
+    def FindJellyfish(self):
+        self.FindFish(4)
 
     def SetSinglesGroup(self, sudoku):
         sudoku.FindSinglesGroup()  # uses standard base hook
@@ -113,47 +202,3 @@ class SamuraiSudoku():
             setSinglesHook = self.makeSetSinglesGroup(sudoku)
             sudoku.FindSinglesBase(setSinglesHook)
             # TODO this is standard base sudoku rule. Samurai rule is different for shared corners
-
-    def GetState(self):
-        return self.state
-    
-    def TakeStep(self):
-        # TODO DRY, add more rules and more states
-        self.steps = { 0: 'Set single candidate as solution in cells', 1: 'Find possible candidates'
-                , 2: 'Find single candidate in row, column and group', 3: 'Update sudoku'
-                , 4: "Done, solved"}
-        if not self.Solved:
-            result = self.steps[self.state]
-            match self.state:
-                case 0:
-                    self.SetSingleCandidatesAsnewNumber()
-                    if self.Changed:
-                        result = result + ", yes"
-                        self.state = 3
-                    else:
-                        result = result + ", no"
-                        self.state = 1
-                case 1:
-                    self.FindPossibleCandidates()
-                    if self.Changed:
-                        result = result + ", yes"
-                        self.state = 3
-                    else:
-                        result = result + ", no"
-                        self.state = 2
-                case 2:
-                    self.SetSingles()
-                    if self.Changed:
-                        result = result + ", yes"
-                        self.state = 3
-                    else:
-                        result = result + ", no"
-                    self.state = 3
-                case 3:
-                    self.DoChange()
-                    self.state = 0
-        else:
-            result = self.steps[4]
-
-        return result
-   
\ No newline at end of file
@@ -1,55 +1,124 @@
-from tkinter import *
-from tkinter import ttk
-from tkinter import font
+import argparse
+import sys
+import time
 
+# Only the solver modules are imported here, tkinter is imported when the window is started
+# and the generator when puzzles are generated
+from basesudoku import lineFormat
+from basesudoku.search import ENGINES
+from batch import batchSolver
+from batch import pipeline
+from generator import GRADES, EXPERT
 from jigsaw import jigsaw
 from normal import normal
 from samurai import samurai
-from Window.window import Window
 
-class SudokuWindow(Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Sudoku Solver")
-        self.minsize( 100,100)
-        self.maxsize( 200,200)
-        self.geometry("200x200+50+50")
-        self.mainFrame = ttk.Frame( self, width=100, height=100)
-        self.mainFrame.grid(column=0, row=0, sticky=(N, W, E, S))
-        self.columnconfigure(0, weight=1)
-        self.rowconfigure(0, weight=1)
-        self.label=ttk.Label( self.mainFrame
-                , text="Solve a sudoku").grid(row=0, column=0, padx=5, pady=5)
-        
-        self.sudokuvar = StringVar()
-        self.combo = ttk.Combobox( self.mainFrame, textvariable=self.sudokuvar)
-        # TODO self.combo['values'] = ('Normal', 'Jigsaw', 'Hyper', 'X' )
-        self.combo['values'] = ('Normal', 'Jigsaw', 'Samurai')
-        self.combo.grid(row=1, column=0, padx=5, pady=5)
-        self.combo.state(["readonly"])
-        self.combo.current(0)        
-        runButton = ttk.Button( self.mainFrame, text='Solve', command=self.solvesudoku)
-        runButton.grid(row=2, column=0, padx=5, pady=5)
+# Line formats by sudoku type: (parse, serialize)
+FORMATS = { 'normal': (normal.createSudokuFromLine, normal.lineFromSudoku)
+          , 'jigsaw': (jigsaw.createSudokuFromLine, jigsaw.lineFromSudoku)
+          , 'samurai': (samurai.createSudokuFromLine, samurai.lineFromSudoku) }
 
-    def solvesudoku(self):
-        # call sudoku solver selected
-        choice = self.combo.get()
-        if choice == "Jigsaw":
-            sudoku = jigsaw.createSudoku()
-        elif choice == "Normal":
-            sudoku = normal.createSudoku()
-        elif choice == "Hyper":
-            pass
-        elif choice == "Samurai":
-            sudoku = samurai.createSudoku()
-        elif choice == "X":
-            pass
-        else:
-            pass
-        window = Window( self, choice, sudoku)
-        window.grab_set()
+def SolveCommand(args):
+    # Prints the solution of each puzzle, or its status when not solved, and a summary
+    # with timing on stderr. Returns exit code 0 when all puzzles are solved.
+    parse, serialize = FORMATS[args.type]
+    start = time.perf_counter()
+    count = 0
+    solved = 0
+    results = batchSolver.SolveBatch(pipeline.ReadLines(args.files), args.workers, args.chunk_size
+                                     , parse, serialize, args.engine, args.max_nodes)
+    try:
+        for result in results:
+            count += 1
+            if result.Status == batchSolver.SOLVED:
+                solved += 1
+                line = result.Solution
+            else:
+                line = result.Status
+            if args.time:
+                line = "%s\t%.6f" % (line, result.Seconds)
+            print(line)
+    except ValueError as error:
+        # bad workers or chunk size, bad puzzles are told by their status
+        print("Can't solve: " + str(error), file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - start
+    print("Solved %d of %d puzzles in %.3f s, %.1f puzzles/s" % (solved, count, seconds, count/seconds if seconds > 0 else 0.0)
+          , file=sys.stderr)
+    return 0 if solved == count else 1
 
+def GenerateCommand(args):
+    # Prints the line of each generated puzzle and a summary of the grades on stderr.
+    # Returns 1 when puzzles missed the grade asked for.
+    from generator import generator
+    shape = None
+    dimension = args.dimension
+    start = time.perf_counter()
+    grades = {}
+    missed = 0
+    try:
+        if args.shape is not None:
+            dimension = lineFormat.GridDimension(args.shape)
+            groups = lineFormat.ParseGrid(args.shape, dimension - 1, lineFormat.GROUPS)
+            shape = [groups[r*dimension:(r+1)*dimension] for r in range(dimension)]
+        layout = generator.Layout(args.type, dimension, shape)
+        for puzzle in generator.GenerateBatch(layout, args.count, args.seed, args.grade, args.workers
+                                              , args.chunk_size, args.min_clues, args.attempts):
+            grades[puzzle.Grade] = grades.get(puzzle.Grade, 0) + 1
+            missed += puzzle.Missed
+            line = puzzle.Line
+            if args.show_grade:
+                line = "%s\t%s" % (line, puzzle.Grade)
+            print(line)
+    except ValueError as error:
+        print("Can't generate: " + str(error), file=sys.stderr)
+        return 2
+    seconds = time.perf_counter() - start
+    print("Generated %d puzzles in %.3f s, %s" % (args.count, seconds
+          , ', '.join(["%s %d" % (grade, grades[grade]) for grade in sorted(grades)])), file=sys.stderr)
+    if missed:
+        print("Warning: %d puzzles are not %s after %d attempts each" % (missed, args.grade, args.attempts), file=sys.stderr)
+    return 0 if missed == 0 else 1
 
-#main
-mainWindow = SudokuWindow()
-mainWindow.mainloop()
+def WindowCommand(args):
+    from Window.SudokuWindow import SudokuWindow
+    mainWindow = SudokuWindow()
+    mainWindow.mainloop()
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='sudoku', description='Sudoku solver, starts the window without a command')
+    commands = parser.add_subparsers(dest='command')
+    solve = commands.add_parser('solve', help='solve puzzles, one for each line')
+    solve.add_argument('files', nargs='*', default=['-'], help="puzzle files, '-' is stdin (default)")
+    solve.add_argument('--type', choices=sorted(FORMATS), default='normal', help='sudoku type')
+    solve.add_argument('--engine', choices=sorted(ENGINES), default='dlx', help='solver engine')
+    solve.add_argument('--workers', type=int, default=1, help='worker processes')
+    solve.add_argument('--chunk-size', type=int, default=64, help='puzzles sent to a worker at a time')
+    solve.add_argument('--max-nodes', type=int, default=None, help='give up after this many search nodes')
+    solve.add_argument('--time', action='store_true', help='print seconds for each puzzle')
+    generate = commands.add_parser('generate', help='generate puzzles with a unique solution, one for each line')
+    generate.add_argument('--type', choices=sorted(FORMATS), default='normal', help='sudoku type')
+    generate.add_argument('--dimension', type=int, default=9, help='numbers of a row')
+    generate.add_argument('--shape', default=None, help="group letter of each cell of a jigsaw, 'A' is group 0")
+    generate.add_argument('--count', type=int, default=1, help='puzzles to generate')
+    generate.add_argument('--seed', default='0', help='seed of the random numbers, the same seed gives the same puzzles')
+    generate.add_argument('--grade', choices=[name for name, cost in GRADES] + [EXPERT]
+                          , default=None, help='grade to try to hit')
+    generate.add_argument('--attempts', type=int, default=20, help='puzzles to try for each to hit the grade')
+    generate.add_argument('--min-clues', type=int, default=0, help='stop removing clues at this many')
+    generate.add_argument('--workers', type=int, default=1, help='worker processes')
+    generate.add_argument('--chunk-size', type=int, default=4, help='puzzles generated by a worker at a time')
+    generate.add_argument('--show-grade', action='store_true', help='print the grade after each puzzle')
+    commands.add_parser('window', help='start the window (default)')
+    args = parser.parse_args(argv)
+    if args.command == 'solve':
+        result = SolveCommand(args)
+    elif args.command == 'generate':
+        result = GenerateCommand(args)
+    else:
+        result = WindowCommand(args)
+    return result
+
+if __name__ == '__main__':
+    sys.exit(main())